@@ -9,8 +9,21 @@ License: MIT License (https://opensource.org/licenses/MIT)
 __version__ = '0.2.1'
 
 
-import time
-import machine
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+try:
+    from time import sleep_ms
+except ImportError:
+    from time import sleep
+    def sleep_ms(ms):
+        sleep(ms/1000)
+try:
+    import machine
+except ImportError:
+    machine = None
 
 
 MLX90615_I2C_DEFAULT_ADDR = const(0x5B)
@@ -70,7 +83,7 @@ class MLX90615:
         crc = self._crc8(crc, msb)
         self.buf[0] = lsb; self.buf[1] = msb; self.buf[2] = crc
         self.i2c.writeto_mem(self.address, register, self.buf)
-        time.sleep_ms(eeprom_time)
+        sleep_ms(eeprom_time)
         if read_check:
             try:
                 data_read = self.read16(register)
@@ -78,7 +91,7 @@ class MLX90615:
                 raise Exception("Error reading after writing to EEPROM register {:02x}.\n{}".format(register, err))
             else:
                 if data != data_read:
-                    raise Exception("Error reading after writing to EEPROM register {:02x}.\n{}".format(register, err))
+                    raise Exception("Error reading after writing to EEPROM register {:02x}.\nRead {:04x} instead of {:04x}.".format(register, data_read, data))
 
     def read_ambient_temp(self, pec_check=True):
         try:
@@ -138,15 +151,15 @@ class MLX90615:
         if (value >= 5) and (value <= 100):
             e = round((value*0x4000)/100)
             try:
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_EMISSIVITY, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error erasing EEPROM emissivity.\n{}".format(err))
             else:
                 try:
                     self.write16(_REG_EMISSIVITY, e, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error writing EEPROM emissivity.\n{}".format(err))
         else:
@@ -163,15 +176,15 @@ class MLX90615:
             if (addr >= 0x08) and (addr <= 0x77):
                 d = 0x3500 | addr       
                 try:
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                     self.write16(_REG_SLAVE_I2C_ADDRESS, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error erasing EEPROM I2C address.\n{}".format(err))
                 else:
                     try:
                         self.write16(_REG_SLAVE_I2C_ADDRESS, d, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                        time.sleep_ms(eeprom_write_time)
+                        sleep_ms(eeprom_write_time)
                     except Exception as err:
                         raise Exception("Error writing EEPROM I2C address.\n{}".format(err))
             else:
@@ -189,16 +202,16 @@ class MLX90615:
     def wake(self, scl_pin):
         p = machine.Pin(scl_pin, machine.Pin.OUT)
         p.value(0)
-        time.sleep_ms(50)
+        sleep_ms(50)
         self.i2c.start()
-        time.sleep_ms(500)
+        sleep_ms(500)
         if ((self.address >= 0x08) and (self.address <= 0x77)) and (not (self.address in self.i2c.scan())):
             raise Exception("I2C has not restarted with MLX90615 I2C address {:02x}.".format(self.address))
 
     def pwm_to_i2c(self, scl_pin):
         p = machine.Pin(scl_pin, machine.Pin.OUT)
         p.value(0)
-        time.sleep_ms(100)
+        sleep_ms(100)
         self.i2c.start()
         if ((self.address >= 0x08) and (self.address <= 0x77)) and (not (self.address in self.i2c.scan())):
             raise Exception("I2C has not restarted with MLX90615 I2C address {:02x}.".format(self.address))
@@ -212,15 +225,15 @@ class MLX90615:
     def set_pwm_tmin(self, tmin=0x355B, eeprom_read_check=False, eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
         if self.address == 0:
             try:
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_PWM_TMIN, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error erasing EEPROM PWM TMIN.\n{}".format(err))
             else:
                 try:
                     self.write16(_REG_PWM_TMIN, tmin, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error writing EEPROM PWM TMIN.\n{}".format(err))
         else:
@@ -234,15 +247,15 @@ class MLX90615:
 
     def set_pwm_trange(self, trange=0x09C3, eeprom_read_check=False, eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
         try:
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_PWM_TRANGE, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
         except Exception as err:
             raise Exception("Error erasing EEPROM PWM TRANGE.\n{}".format(err))
         else:
             try:
                 self.write16(_REG_PWM_TRANGE, trange, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error writing EEPROM PWM TRANGE.\n{}".format(err))
 
@@ -262,15 +275,15 @@ class MLX90615:
             if not pwm:
                 d |= 0x0001
             try:
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_CONFIG, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error erasing EEPROM config register.\n{}".format(err))
             else:
                 try:
                     self.write16(_REG_CONFIG, d, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error writing EEPROM config register.\n{}".format(err))
 
@@ -290,15 +303,15 @@ class MLX90615:
             if pwm_fast:
                 d |= 0x0002
             try:
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_CONFIG, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error erasing EEPROM config register.\n{}".format(err))
             else:
                 try:
                     self.write16(_REG_CONFIG, d, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error writing EEPROM config register.\n{}".format(err))
 
@@ -318,15 +331,15 @@ class MLX90615:
             if not object_temp:
                 d |= 0x0004               
             try:
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_CONFIG, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error erasing EEPROM config register.\n{}".format(err))
             else:
                 try:
                     self.write16(_REG_CONFIG, d, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error writing EEPROM config register.\n{}".format(err))
 
@@ -345,14 +358,14 @@ class MLX90615:
             d &= 0x8FFF
             d |= (iir & 0x0007) << 12
             try:
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_CONFIG, 0x0000, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
             except Exception as err:
                 raise Exception("Error erasing EEPROM config register.\n{}".format(err))
             else:
                 try:
                     self.write16(_REG_CONFIG, d, read_check=eeprom_read_check, eeprom_time=eeprom_write_time)
-                    time.sleep_ms(eeprom_write_time)
+                    sleep_ms(eeprom_write_time)
                 except Exception as err:
                     raise Exception("Error writing EEPROM config register.\n{}".format(err))
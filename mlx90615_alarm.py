@@ -0,0 +1,152 @@
+"""
+MicroPython threshold/alarm event engine for MLX90615 IR temperature sensor readings (integer 100x Celsius degrees) :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import struct
+from array import array
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+try:
+    from time import ticks_ms
+except ImportError:
+    from time import monotonic
+    def ticks_ms():
+        return int(monotonic()*1000)
+
+
+# ticks are wrapped to 30 bits, as in MicroPython 32 bits ports, so they fit in array('i') after days of uptime
+_TICKS_MAX = const((1 << 30) - 1)
+_TICKS_HALF = const(1 << 29)
+
+
+def _ticks_diff(t1, t0):
+    return ((t1 - t0 + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+
+EVENT_NONE = const(0)
+EVENT_LEVEL = const(1)                 # level (band) changed, after hysteresis and dwell time
+EVENT_RATE = const(2)                  # rate of change above the limit
+EVENT_HEARTBEAT = const(3)             # periodic, without other events
+EVENT_ERROR = const(4)                 # sensor reading error
+
+EVENT_FORMAT = '<BBiII'                # kind, level, value (0.01 C or 0.01 C/s), sensor ID, ticks (ms)
+EVENT_SIZE = const(14)
+
+
+def pack_event(buf, kind, level, value, sensor_id, ticks):
+    # packs an event into the preallocated bytearray 'buf' of EVENT_SIZE bytes
+    struct.pack_into(EVENT_FORMAT, buf, 0, kind, level, value, sensor_id, ticks & 0xFFFFFFFF)
+    return buf
+
+
+class AlarmEngine:
+    def __init__(self, thresholds=(3750,), hysteresis=20, dwell_ms=0, rate=None, rate_samples=4, heartbeat_ms=None,
+                 emit=None, sensor_id=0):
+        # levels : 0 below thresholds[0], 1 between thresholds[0] and thresholds[1], etc
+        self.thresholds = tuple(sorted(thresholds))
+        self.hysteresis = hysteresis
+        self.dwell_ms = dwell_ms
+        self.rate = rate                  # rate of change limit in 0.01 C/s, or None
+        self.heartbeat_ms = heartbeat_ms
+        self.emit = emit
+        self.sensor_id = sensor_id
+        self.level = None
+        self.pending = None
+        self.pending_since = 0
+        self.rate_ticks = array('i', [0]*rate_samples)
+        self.rate_values = array('i', [0]*rate_samples)
+        self.rate_count = 0
+        self.rate_active = False
+        self.last_event = 0
+        self.error = False
+
+    def _level(self, value):
+        # band of the value, with hysteresis to go to a lower level
+        level = self.level
+        if level is None:
+            level = 0
+            while (level < len(self.thresholds)) and (value >= self.thresholds[level]):
+                level += 1
+            return level
+        while (level < len(self.thresholds)) and (value >= self.thresholds[level]):
+            level += 1
+        while (level > 0) and (value < self.thresholds[level - 1] - self.hysteresis):
+            level -= 1
+        return level
+
+    def _emit(self, kind, level, value, ticks):
+        self.last_event = ticks
+        if self.emit is not None:
+            self.emit(kind, level, value, self.sensor_id, ticks)
+        return kind
+
+    def _rate(self, value, ticks):
+        # rate of change in 0.01 C/s from the oldest of the last 'rate_samples' readings
+        n = len(self.rate_ticks)
+        i = self.rate_count % n
+        oldest = (self.rate_count + 1) % n if self.rate_count >= n - 1 else 0
+        self.rate_ticks[i] = ticks
+        self.rate_values[i] = value
+        self.rate_count += 1
+        dt = _ticks_diff(ticks, self.rate_ticks[oldest])
+        if (self.rate_count < 2) or (dt <= 0):
+            return 0
+        return (value - self.rate_values[oldest])*1000 // dt
+
+    def update(self, value, ticks=None):
+        # returns the kind of the emitted event, or EVENT_NONE. If there are rate and level events in the same update,
+        # both are emitted (rate first) and EVENT_LEVEL is returned
+        if ticks is None:
+            ticks = ticks_ms()
+        ticks &= _TICKS_MAX
+        self.error = False
+        if self.level is None:
+            self.level = self._level(value)
+            return self._emit(EVENT_LEVEL, self.level, value, ticks)
+        kind = EVENT_NONE
+        if self.rate is not None:
+            rate = self._rate(value, ticks)
+            if abs(rate) >= self.rate:
+                if not self.rate_active:
+                    self.rate_active = True
+                    kind = self._emit(EVENT_RATE, self.level, rate, ticks)
+            elif abs(rate) < self.rate >> 1:
+                self.rate_active = False
+        level = self._level(value)
+        if level == self.level:
+            self.pending = None
+        elif level != self.pending:
+            self.pending = level
+            self.pending_since = ticks
+        if (self.pending is not None) and (_ticks_diff(ticks, self.pending_since) >= self.dwell_ms):
+            self.level = self.pending
+            self.pending = None
+            return self._emit(EVENT_LEVEL, self.level, value, ticks)
+        if (kind == EVENT_NONE) and (self.heartbeat_ms is not None) and \
+                (_ticks_diff(ticks, self.last_event) >= self.heartbeat_ms):
+            return self._emit(EVENT_HEARTBEAT, self.level, value, ticks)
+        return kind
+
+    def poll(self, sensor, ticks=None, pec_check=True):
+        # reads the object temperature of the 'sensor' (MLX90615 object) and updates, an error is emitted only once
+        if ticks is None:
+            ticks = ticks_ms()
+        ticks &= _TICKS_MAX
+        try:
+            value = sensor.read_object_temp(pec_check)
+        except Exception:
+            if self.error:
+                return EVENT_NONE
+            self.error = True
+            return self._emit(EVENT_ERROR, self.level or 0, 0, ticks)
+        return self.update(value, ticks)
@@ -0,0 +1,290 @@
+"""
+Conformance and fault injection suite for all the MLX90615 driver versions, using the emulated sensor (CPython) :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import importlib.util
+import os
+import random
+import time
+import mlx90615_emulator
+
+
+# (name, file, has error checking), the versions with error checking raise exceptions for PEC errors and invalid values
+VARIANTS = (
+    ('full', 'mlx90615.py', True),
+    ('no-errors', 'mlx90615_no-errors_v0.2.1.py', False),
+    ('simple', 'mlx90615_simple.py', True),
+    ('simple_no-errors', 'mlx90615_simple_no-errors_v0.2.1.py', False),
+    ('microbit_no-errors', 'mlx90615_microbit_no-errors.py', False),
+    ('microbit_simple', 'mlx90615_microbit_simple.py', True),
+    ('microbit_simple_no-errors', 'mlx90615_microbit_simple_no-errors.py', False),
+)
+
+READ_OPS = (
+    ('read_ambient_temp', ()), ('read_object_temp', ()), ('read_raw_ir_data', ()), ('read_id', ()),
+    ('read_eeprom', ()), ('read_emissivity', ()), ('read_i2c_address', ()), ('read_pwm_tmin', ()),
+    ('read_pwm_trange', ()), ('read_pwm_mode', ()), ('read_pwm_fast', ()), ('read_pwm_object_temp', ()),
+    ('read_iir_filter', ()),
+) + tuple(('read16', (register,)) for register in tuple(range(0x10, 0x20)) + (0x25, 0x26, 0x27))
+
+WRITE_OPS = ('set_emissivity', 'set_i2c_address', 'set_pwm_tmin', 'set_pwm_trange', 'set_pwm_mode', 'set_pwm_fast',
+             'set_pwm_object_temp', 'set_iir_filter')
+# 'set_...' functions with reading check after writing to EEPROM by default
+READ_CHECKED_WRITE_OPS = ('set_emissivity', 'set_pwm_mode', 'set_pwm_fast', 'set_pwm_object_temp', 'set_iir_filter')
+# 'eeprom_write_time' (ms) used in the writings with faults, some shorter than the emulated EEPROM write time
+WRITE_TIMES = (0, 1, 2, 4, 5, 10, 50)
+
+# exception types raised by the drivers, others (NameError, TypeError, etc) are bugs
+_EXPECTED_EXCEPTIONS = (Exception, OSError)
+
+
+def load_variants(path=None):
+    if path is None:
+        path = os.path.dirname(os.path.abspath(__file__))
+    modules = []
+    for name, filename, checks in VARIANTS:
+        spec = importlib.util.spec_from_file_location('mlx90615_' + name.replace('-', '_'), os.path.join(path, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules.append((name, module, checks))
+    return modules
+
+
+def _random_emulator(rnd):
+    eeprom = [rnd.getrandbits(16) for _ in range(16)]
+    emu = mlx90615_emulator.MLX90615Emulator(eeprom, raw_ir=rnd.getrandbits(16))
+    # RAM temperature registers with random 16 bits values, including invalid ones (> 0x7FFF)
+    emu.object_temp = rnd.getrandbits(16)*2 - 27315
+    emu.ambient_temp = rnd.getrandbits(16)*2 - 27315
+    return emu
+
+
+def _call(obj, op, args, kwargs=None):
+    t0 = time.perf_counter()
+    try:
+        value = getattr(obj, op)(*args, **(kwargs or {}))
+        result = ('value', tuple(value) if isinstance(value, list) else value)
+    except _EXPECTED_EXCEPTIONS as err:
+        result = ('raised',)
+        # the drivers raise a new Exception inside 'except', so a bug may be in the context of the exception
+        while err is not None:
+            if type(err) not in (Exception, OSError):
+                result = ('bug', repr(err))
+                break
+            err = err.__context__
+    return result, time.perf_counter() - t0
+
+
+def _check_reads(case, op, args, results, checks, mismatches):
+    # results of the versions with error checking should be identical, as the ones without error checking,
+    # and both should be identical when the version with error checking returns a value
+    for name, result in results.items():
+        if result[0] == 'bug':
+            mismatches.append((case, op, args, name, result[1]))
+    for group in (True, False):
+        values = {name: r for name, r in results.items() if checks[name] == group}
+        if len(set(values.values())) > 1:
+            mismatches.append((case, op, args, 'versions with' + ('' if group else 'out') + ' error checking differ', values))
+    checked = [r for name, r in results.items() if checks[name] and (r[0] == 'value')]
+    unchecked = [r for name, r in results.items() if not checks[name]]
+    if checked and unchecked and (checked[0] != unchecked[0]):
+        mismatches.append((case, op, args, 'versions with/without error checking differ', results))
+
+
+def _write_args(rnd, op):
+    if op == 'set_emissivity':
+        return (rnd.randrange(0, 110),)
+    if op == 'set_i2c_address':
+        return (rnd.randrange(0, 0x80),)
+    if op in ('set_pwm_tmin', 'set_pwm_trange'):
+        return (rnd.getrandbits(16),)
+    if op == 'set_iir_filter':
+        return (rnd.randrange(1, 8),)
+    return (rnd.random() < 0.5,)
+
+
+def _write_faults(module, op, args, eeprom_seed, fault_seed, write_time, faults):
+    # EEPROM writing with PEC errors, NACKs, jitter and the EEPROM busy while writing, in the emulated bus clock
+    emu = _random_emulator(random.Random(eeprom_seed))
+    bus = mlx90615_emulator.EmulatedI2C(emu, virtual_time=True, seed=fault_seed, **faults)
+    sleep_ms = module.sleep_ms
+    module.sleep_ms = bus.sleep_ms
+    try:
+        result, _ = _call(module.MLX90615(bus, 0), op, args, {'eeprom_write_time': write_time})
+    finally:
+        module.sleep_ms = sleep_ms
+    return result, tuple(emu.eeprom)
+
+
+def run(cases=100, seed=0, pec_error_rate=0.05, nack_rate=0.05, jitter_us=1000, eeprom_write_ms=5, path=None):
+    variants = load_variants(path)
+    checks = {name: c for name, _, c in variants}
+    rnd = random.Random(seed)
+    mismatches = []
+    timing = {name: {} for name, _, _ in variants}
+    for case in range(cases):
+        eeprom_seed = rnd.getrandbits(32)
+        faults = (case % 2) == 1          # odd cases with faults, even cases fault-free
+        bus = mlx90615_emulator.EmulatedI2C(_random_emulator(random.Random(eeprom_seed)),
+                                            pec_error_rate=pec_error_rate if faults else 0,
+                                            nack_rate=nack_rate if faults else 0, jitter_us=jitter_us,
+                                            virtual_time=True)
+        address = bus.devices[0].address
+        sensors = [(name, module.MLX90615(bus, address)) for name, module, _ in variants]
+        for op, args in READ_OPS:
+            op_seed = rnd.getrandbits(32)
+            results = {}
+            for name, sensor in sensors:
+                if hasattr(sensor, op):
+                    bus.reseed(op_seed)       # same faults for all versions
+                    results[name], dt = _call(sensor, op, args)
+                    if not faults:
+                        timing[name].setdefault(op, []).append(dt)
+            _check_reads(case, op, args, results, checks, mismatches)
+        # EEPROM writes with address 0x00 : fault-free, comparing the EEPROM after writing, then with faults,
+        # where the versions with reading check should raise an exception if the EEPROM isn't as fault-free
+        write_faults = {'pec_error_rate': pec_error_rate, 'nack_rate': nack_rate, 'jitter_us': jitter_us,
+                        'eeprom_write_ms': eeprom_write_ms}
+        for op in WRITE_OPS:
+            args = _write_args(rnd, op)
+            write_time = rnd.choice(WRITE_TIMES)
+            fault_seed = rnd.getrandbits(32)
+            eeproms = {}
+            for name, module, _ in variants:
+                emu = _random_emulator(random.Random(eeprom_seed))
+                sensor = module.MLX90615(mlx90615_emulator.EmulatedI2C(emu), 0)
+                if not hasattr(sensor, op):
+                    continue
+                result, dt = _call(sensor, op, args, {'eeprom_write_time': 0})
+                if result[0] == 'bug':
+                    mismatches.append((case, op, args, name, result[1]))
+                eeproms[name] = tuple(emu.eeprom)
+                timing[name].setdefault(op, []).append(dt)
+                result, eeprom = _write_faults(module, op, args, eeprom_seed, fault_seed, write_time,
+                                               write_faults)
+                if result[0] == 'bug':
+                    mismatches.append((case, op, args + (write_time,), name, result[1]))
+                elif checks[name] and (op in READ_CHECKED_WRITE_OPS) and (result[0] == 'value') and \
+                        (eeprom != eeproms[name]):
+                    mismatches.append((case, op, args + (write_time,), name, 'EEPROM writing error not detected'))
+            if len(set(eeproms.values())) > 1:
+                mismatches.append((case, op, args, 'EEPROM after writing differs', eeproms))
+    mismatches.extend(_check_pinned(variants))
+    mismatches.extend(_check_filters())
+    for name in timing:
+        timing[name] = {op: 1000000*sum(t)/len(t) for op, t in timing[name].items()}
+    return {'cases': cases, 'mismatches': mismatches, 'timing': timing}
+
+
+class _SmallInt(int):
+    # integer checking that the results of all operations are MicroPython small integers (-2**30 <= n < 2**30),
+    # so there is no long integer allocation
+    overflows = []
+
+    def _check(self, result, op):
+        if result is NotImplemented:
+            return result
+        if not ((result >= -(1 << 30)) and (result < (1 << 30))):
+            _SmallInt.overflows.append((op, int(self), result))
+        return _SmallInt(result)
+
+
+for _op in ('add', 'sub', 'mul', 'floordiv', 'lshift', 'rshift', 'and', 'or', 'radd', 'rsub', 'rmul', 'rfloordiv',
+            'rlshift', 'rrshift', 'rand', 'ror', 'neg', 'abs'):
+    def _method(self, *args, _name='__{}__'.format(_op)):
+        return self._check(getattr(int, _name)(self, *args), _name)
+    setattr(_SmallInt, '__{}__'.format(_op), _method)
+
+
+def _check_filters():
+    # filters with large steps and spikes, up to the range of the RAM temperature registers (-273.15 to 1037.55 C),
+    # should have all intermediate values as small integers
+    import mlx90615_filters
+    mismatches = []
+    t_min = -27315
+    t_max = 0xFFFF*2 - 27315
+    inputs = [3621]*5 + [t_max] + [3621]*5 + [t_min]*3 + [t_max]*3 + [3621]*50 + [3600 + 500*(i & 1) for i in range(20)]
+    filters = [('KalmanFilter', (q, r)) for q, r in ((1, 100), (0, 100), (0, 1), (1000, 30000), (32766, 1), (1, 32766))] + \
+              [('EMAFilter', (shift,)) for shift in (1, 2, 8)] + [('MedianFilter', (5,))]
+    for name, args in filters:
+        _SmallInt.overflows = []
+        filt = getattr(mlx90615_filters, name)(*[_SmallInt(a) for a in args])
+        for x in inputs:
+            filt.update(_SmallInt(x))
+        if _SmallInt.overflows:
+            mismatches.append(('pinned', name, args, 'filters', 'not small integer : {}'.format(_SmallInt.overflows[0])))
+    return mismatches
+
+
+def _check_pinned(variants):
+    # specific behaviours, documented in the README
+    mismatches = []
+    modules = {name: module for name, module, _ in variants}
+    # reading check after writing to a not erased EEPROM register should raise an exception with the read value
+    emu = mlx90615_emulator.MLX90615Emulator()
+    sensor = modules['full'].MLX90615(mlx90615_emulator.EmulatedI2C(emu))
+    try:
+        sensor.write16(0x11, 0x0001, read_check=True, eeprom_time=0)
+        mismatches.append(('pinned', 'write16', (), 'full', 'no exception for EEPROM write not confirmed'))
+    except Exception as err:
+        if type(err) is not Exception:
+            mismatches.append(('pinned', 'write16', (), 'full', repr(err)))
+    # PWM TRANGE register doesn't have I2C address bits, so it can be set with the current I2C address <> 0x00,
+    # unlike PWM TMIN
+    for name in ('full', 'no-errors'):
+        emu = mlx90615_emulator.MLX90615Emulator()
+        sensor = modules[name].MLX90615(mlx90615_emulator.EmulatedI2C(emu))
+        sensor.set_pwm_trange(0x0800, eeprom_write_time=0)
+        if emu.eeprom[1] != 0x0800:
+            mismatches.append(('pinned', 'set_pwm_trange', (0x0800,), name, 'not written with address 0x5B'))
+        try:
+            sensor.set_pwm_tmin(0x3500, eeprom_write_time=0)
+        except Exception:
+            pass
+        if emu.eeprom[0] != mlx90615_emulator.DEFAULT_EEPROM[0]:
+            mismatches.append(('pinned', 'set_pwm_tmin', (0x3500,), name, 'written with address 0x5B'))
+    return mismatches
+
+
+def print_report(report):
+    names = [name for name, _, _ in VARIANTS]
+    ops = []
+    for name in names:
+        for op in report['timing'][name]:
+            if op not in ops:
+                ops.append(op)
+    print("Time per operation (us), fault-free cases :")
+    print("{:22s} ".format('') + ' '.join('{:>10s}'.format(n[:10]) for n in names))
+    for op in ops:
+        print("{:22s} ".format(op) + ' '.join('{:10.1f}'.format(report['timing'][n][op]) if op in report['timing'][n]
+                                               else '{:>10s}'.format('-') for n in names))
+    print("{} cases, {} mismatches.".format(report['cases'], len(report['mismatches'])))
+    for mismatch in report['mismatches'][:20]:
+        print(mismatch)
+
+
+def main():
+    import argparse
+    import sys
+    parser = argparse.ArgumentParser(description="Conformance and fault injection suite of the MLX90615 drivers.")
+    parser.add_argument('--cases', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pec-error-rate', type=float, default=0.05)
+    parser.add_argument('--nack-rate', type=float, default=0.05)
+    parser.add_argument('--jitter-us', type=int, default=1000, help="random delay of each I2C transaction")
+    parser.add_argument('--eeprom-write-ms', type=int, default=5, help="emulated EEPROM write time")
+    args = parser.parse_args()
+    report = run(args.cases, args.seed, args.pec_error_rate, args.nack_rate, args.jitter_us, args.eeprom_write_ms)
+    print_report(report)
+    sys.exit(1 if report['mismatches'] else 0)
+
+
+if __name__ == '__main__':
+    main()
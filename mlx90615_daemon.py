@@ -0,0 +1,291 @@
+"""
+Sampling daemon for MLX90615 IR temperature I2C sensors on Linux (CPython), publishing the samples to many processes
+in a lock-free shared memory ring, with a local socket fallback :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import os
+import socket
+import struct
+import threading
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+
+RING_DEFAULT_NAME = 'mlx90615'
+RING_DEFAULT_CAPACITY = 1024
+REFRESH_PERIOD_S = 0.5                 # MLX90615 RAM refresh period, 2 Hz
+
+_MAGIC = b'MLXR'
+_HEADER = struct.Struct('<4sIIQ')      # magic, capacity, slot size, head (number of samples written)
+_HEADER_SIZE = 64
+_HEAD_OFFSET = 12
+_SLOT = struct.Struct('<QdIiiHBB')     # sequence, timestamp, sensor ID, object temp., ambient temp., raw IR, address, status
+_SEQ = struct.Struct('<Q')
+_U64 = struct.Struct('<Q')
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+Sample = namedtuple('Sample', ('timestamp', 'sensor_id', 'object_temp', 'ambient_temp', 'raw_ir', 'address', 'status'))
+
+_created = set()                       # names of the shared memory rings created in this process
+
+
+def _attach(name):
+    # readers should not unlink the shared memory at exit, as the resource tracker of Python < 3.13 does
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name)
+        # the ring created in this process stays registered, to be unlinked by its writer
+        if shm._name not in _created:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class RingWriter:
+    def __init__(self, name=RING_DEFAULT_NAME, capacity=RING_DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(name, create=True, size=_HEADER_SIZE + capacity*_SLOT.size)
+        _created.add(self.shm._name)
+        self.buf = self.shm.buf
+        _HEADER.pack_into(self.buf, 0, _MAGIC, capacity, _SLOT.size, 0)
+        self.head = 0
+
+    def publish(self, timestamp, sensor_id, object_temp, ambient_temp, raw_ir, address, status=STATUS_OK):
+        # seqlock of each slot : odd sequence while writing, even when the sample 'head' is complete
+        n = self.head
+        offset = _HEADER_SIZE + (n % self.capacity)*_SLOT.size
+        _SEQ.pack_into(self.buf, offset, 2*n + 1)
+        _SLOT.pack_into(self.buf, offset, 2*n + 1, timestamp, sensor_id, object_temp, ambient_temp, raw_ir, address, status)
+        _SEQ.pack_into(self.buf, offset, 2*n + 2)
+        self.head = n + 1
+        _U64.pack_into(self.buf, _HEAD_OFFSET, self.head)
+
+    def close(self, unlink=True):
+        self.buf = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+            _created.discard(self.shm._name)
+
+
+class RingReader:
+    def __init__(self, name=RING_DEFAULT_NAME, from_start=False):
+        self.shm = _attach(name)
+        self.buf = self.shm.buf
+        magic, self.capacity, slot_size, head = _HEADER.unpack_from(self.buf, 0)
+        if (magic != _MAGIC) or (slot_size != _SLOT.size):
+            raise Exception("Invalid MLX90615 shared memory ring '{}'.".format(name))
+        self.next = max(head - self.capacity, 0) if from_start else head
+        self.lost = 0
+
+    def head(self):
+        return _U64.unpack_from(self.buf, _HEAD_OFFSET)[0]
+
+    def _slot(self, n):
+        # returns the sample 'n' read directly from the shared memory, or None if it was overwritten while reading
+        offset = _HEADER_SIZE + (n % self.capacity)*_SLOT.size
+        s = _SLOT.unpack_from(self.buf, offset)
+        if (s[0] != 2*n + 2) or (_SEQ.unpack_from(self.buf, offset)[0] != s[0]):
+            return None
+        return Sample(*s[1:])
+
+    def read(self, max_samples=None):
+        # returns the list of new samples since the last call
+        head = self.head()
+        if head - self.next > self.capacity:
+            self.lost += head - self.capacity - self.next
+            self.next = head - self.capacity
+        if max_samples is not None:
+            head = min(head, self.next + max_samples)
+        samples = []
+        while self.next < head:
+            sample = self._slot(self.next)
+            if sample is None:
+                self.lost += 1
+            else:
+                samples.append(sample)
+            self.next += 1
+        return samples
+
+    def latest(self):
+        head = self.head()
+        return self._slot(head - 1) if head else None
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+
+class SocketReader:
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.pending = b''
+
+    def read(self, timeout=None):
+        # returns the list of samples received, waiting up to 'timeout' s for them
+        self.sock.settimeout(timeout)
+        try:
+            data = self.sock.recv(64*_SLOT.size)
+        except socket.timeout:
+            return []
+        if not data:
+            raise Exception("MLX90615 sampling daemon closed the socket.")
+        data = self.pending + data
+        n = len(data) // _SLOT.size
+        self.pending = data[n*_SLOT.size:]
+        return [Sample(*_SLOT.unpack_from(data, i*_SLOT.size)[1:]) for i in range(n)]
+
+    def close(self):
+        self.sock.close()
+
+
+class SamplingDaemon:
+    def __init__(self, sensors, name=RING_DEFAULT_NAME, capacity=RING_DEFAULT_CAPACITY, period=REFRESH_PERIOD_S,
+                 socket_path=None, before_sweep=None, pec_check=True):
+        # 'sensors' is a list of MLX90615 objects, on one or more I2C buses owned by the daemon
+        self.sensors = [(sensor, sensor.read_id(pec_check)) for sensor in sensors]
+        self.ring = RingWriter(name, capacity)
+        self.period = period
+        self.before_sweep = before_sweep
+        self.pec_check = pec_check
+        self.stopping = threading.Event()
+        self.thread = None
+        self.clients = []
+        self.server = None
+        self.socket_path = socket_path
+        if socket_path is not None:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.server.bind(socket_path)
+            self.server.listen()
+            threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while not self.stopping.is_set():
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            client.setblocking(False)
+            self.clients.append(client)
+
+    def _send(self, record):
+        for client in list(self.clients):
+            try:
+                client.sendall(record)
+            except OSError:
+                # slow or closed clients are dropped, the shared memory ring is the main interface
+                self.clients.remove(client)
+                client.close()
+
+    def sweep(self):
+        if self.before_sweep is not None:
+            self.before_sweep()
+        for sensor, sensor_id in self.sensors:
+            timestamp = time.time()
+            try:
+                object_temp = sensor.read_object_temp(self.pec_check)
+                ambient_temp = sensor.read_ambient_temp(self.pec_check)
+                raw_ir = sensor.read_raw_ir_data(self.pec_check)
+                status = STATUS_OK
+            except Exception:
+                object_temp = ambient_temp = raw_ir = 0
+                status = STATUS_ERROR
+            self.ring.publish(timestamp, sensor_id, object_temp, ambient_temp, raw_ir, sensor.address, status)
+            if self.clients:
+                self._send(_SLOT.pack(0, timestamp, sensor_id, object_temp, ambient_temp, raw_ir, sensor.address, status))
+
+    def run(self, count=None):
+        n = 0
+        t = time.monotonic()
+        while (not self.stopping.is_set()) and ((count is None) or (n < count)):
+            self.sweep()
+            n += 1
+            t += self.period
+            self.stopping.wait(max(t - time.monotonic(), 0))
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def stop(self):
+        self.stopping.set()
+
+    def close(self):
+        # the sampling thread should end before closing the sockets and the shared memory ring
+        self.stop()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.server is not None:
+            self.server.close()
+            os.unlink(self.socket_path)
+        for client in self.clients:
+            client.close()
+        self.ring.close()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="MLX90615 sampling daemon with emulated sensors, or client.")
+    parser.add_argument('--name', default=RING_DEFAULT_NAME, help="shared memory ring name")
+    parser.add_argument('--socket', help="local socket path")
+    parser.add_argument('--emulate', type=int, default=2, help="number of emulated sensors")
+    parser.add_argument('--period', type=float, default=REFRESH_PERIOD_S)
+    parser.add_argument('--client', action='store_true', help="print the samples from the ring (or socket)")
+    args = parser.parse_args()
+    if args.client:
+        reader = SocketReader(args.socket) if args.socket else RingReader(args.name)
+        try:
+            while True:
+                for sample in reader.read(args.period) if args.socket else reader.read():
+                    print(sample)
+                if not args.socket:
+                    time.sleep(args.period)
+        except KeyboardInterrupt:
+            reader.close()
+        return
+    import random
+    import signal
+    import mlx90615
+    import mlx90615_emulator
+    emus = []
+    for i in range(args.emulate):
+        eeprom = list(mlx90615_emulator.DEFAULT_EEPROM)
+        eeprom[0] = (eeprom[0] & 0xFF80) | (0x5A + i)
+        eeprom[14] += i
+        emus.append(mlx90615_emulator.MLX90615Emulator(eeprom, object_temp=3600 + 10*i, noise=5))
+    i2c = mlx90615_emulator.EmulatedI2C(*emus)
+
+    def before_sweep():
+        for emu in emus:
+            emu.object_temp += random.choice((-2, 0, 2))
+            emu.refresh()
+
+    daemon = SamplingDaemon([mlx90615.MLX90615(i2c, emu.address) for emu in emus], args.name,
+                            period=args.period, socket_path=args.socket, before_sweep=before_sweep)
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+MicroPython I2C bus discovery for MLX90615 IR temperature sensors, with a fingerprint cache of each sensor :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import json
+import mlx90615
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+    def ticks_us():
+        return int(perf_counter()*1000000)
+    def ticks_diff(t1, t0):
+        return t1 - t0
+
+
+CACHE_FILE = 'mlx90615_cache.json'
+_EEPROM_TRANSACTIONS = 16              # read_eeprom() reads 16 registers
+_ID_TRANSACTIONS = 2                   # read_id() reads 2 registers
+
+
+def eeprom_hash(eeprom):
+    # FNV-1a 32 bits of the EEPROM words
+    h = 0x811C9DC5
+    for d in eeprom:
+        h = ((h ^ (d & 0xFF))*0x01000193) & 0xFFFFFFFF
+        h = ((h ^ (d >> 8))*0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def eeprom_config(eeprom):
+    # same keys and values as the provisioning manifest of 'mlx90615_provision.py'
+    config = eeprom[0x12 - 0x10]
+    e = eeprom[0x13 - 0x10]
+    if e >= 32768:
+        e = 32768 - e
+    return {'i2c_address': eeprom[0] & 0x007F,
+            'pwm_tmin': eeprom[0] & 0xFF80,
+            'pwm_trange': eeprom[1],
+            'pwm': (config & 0x0001) == 0,
+            'pwm_fast': (config & 0x0002) != 0,
+            'pwm_object_temp': (config & 0x0004) == 0,
+            'iir': (config & 0x7000) >> 12,
+            'emissivity': round(100*e/0x4000)}
+
+
+def load_cache(filename=CACHE_FILE):
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache, filename=CACHE_FILE):
+    with open(filename, 'w') as f:
+        json.dump(cache, f)
+
+
+def discover(i2c, cache_file=CACHE_FILE, pec_check=True, refresh=False):
+    # returns ({address: {'sensor', 'id', 'eeprom', 'config', 'cached'}}, report)
+    cache = load_cache(cache_file)
+    changed = False
+    sensors = {}
+    report = {'scanned': 0, 'cached': 0, 'read': 0, 'transactions': 1}
+    id_us = 0
+    t0 = ticks_us()
+    addresses = i2c.scan()
+    report['scanned'] = len(addresses)
+    for address in addresses:
+        sensor = mlx90615.MLX90615(i2c, address)
+        t1 = ticks_us()
+        try:
+            sensor_id = sensor.read_id(pec_check)
+        except Exception:
+            continue                      # not a MLX90615, or PEC error
+        finally:
+            id_us += ticks_diff(ticks_us(), t1)
+            report['transactions'] += _ID_TRANSACTIONS
+        key = str(sensor_id)
+        entry = cache.get(key)
+        if (not refresh) and (entry is not None) and (entry['address'] == address) and (entry['hash'] == eeprom_hash(entry['eeprom'])):
+            report['cached'] += 1
+            eeprom = entry['eeprom']
+            config = entry['config']
+            cached = True
+        else:
+            try:
+                eeprom = sensor.read_eeprom(pec_check)
+            except Exception:
+                continue
+            finally:
+                report['transactions'] += _EEPROM_TRANSACTIONS
+            config = eeprom_config(eeprom)
+            cache[key] = {'address': address, 'hash': eeprom_hash(eeprom), 'config': config, 'eeprom': eeprom}
+            changed = True
+            report['read'] += 1
+            cached = False
+        sensors[address] = {'sensor': sensor, 'id': sensor_id, 'eeprom': eeprom, 'config': config, 'cached': cached}
+    if changed:
+        save_cache(cache, cache_file)
+    report['elapsed_ms'] = ticks_diff(ticks_us(), t0) / 1000
+    # saved time estimated with the mean time per register reading of read_id()
+    report['saved_transactions'] = report['cached']*_EEPROM_TRANSACTIONS
+    id_transactions = (report['transactions'] - 1 - report['read']*_EEPROM_TRANSACTIONS) or 1
+    report['saved_ms'] = report['saved_transactions']*id_us / id_transactions / 1000
+    return sensors, report
@@ -0,0 +1,79 @@
+"""
+MicroPython software emissivity correction for MLX90615 IR temperature sensor, without EEPROM writes :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+from array import array
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
+
+_KELVIN_MIN = const(200)               # lookup table range in K, -73.15 to 726.85 C
+_KELVIN_MAX = const(1000)
+_CENTI_KELVIN_OFFSET = const(27315)
+
+# (T/K)**4 / 2**16 for each 1 K from _KELVIN_MIN to _KELVIN_MAX, so all values and products are small integers
+_T4 = array('L', (int((k*k/256.0)**2) for k in range(_KELVIN_MIN, _KELVIN_MAX + 1)))
+
+
+def radiance(t):
+    # t in 0.01 C, linear interpolation of the 1 K lookup table
+    t += _CENTI_KELVIN_OFFSET
+    if t < _KELVIN_MIN*100:
+        t = _KELVIN_MIN*100
+    elif t >= _KELVIN_MAX*100:
+        t = _KELVIN_MAX*100 - 1
+    i = t//100 - _KELVIN_MIN
+    return _T4[i] + (_T4[i + 1] - _T4[i])*(t % 100)//100
+
+
+def temperature(r):
+    # inverse of radiance(), returning 0.01 C, by binary search of the lookup table
+    lo = 0
+    hi = len(_T4) - 1
+    if r <= _T4[lo]:
+        return _KELVIN_MIN*100 - _CENTI_KELVIN_OFFSET
+    if r >= _T4[hi]:
+        return _KELVIN_MAX*100 - _CENTI_KELVIN_OFFSET
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if _T4[mid] <= r:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + _KELVIN_MIN)*100 + (100*(r - _T4[lo]) + (_T4[hi] - _T4[lo])//2)//(_T4[hi] - _T4[lo]) - _CENTI_KELVIN_OFFSET
+
+
+def correct(object_temp, ambient_temp, emissivity=100, eeprom_emissivity=100):
+    # object_temp measured with 'eeprom_emissivity' set in EEPROM, both emissivities as integers from 5 to 100
+    if not ((emissivity >= 5) and (emissivity <= 100)):
+        raise Exception("Error : emissivity value {} out of range (5 <= e <= 100).".format(emissivity))
+    if emissivity == eeprom_emissivity:
+        return object_temp
+    ra = radiance(ambient_temp)
+    return temperature(ra + ((radiance(object_temp) - ra)*eeprom_emissivity + emissivity//2)//emissivity)
+
+
+class EmissivityCorrection:
+    def __init__(self, sensor, emissivity=100, eeprom_emissivity=None):
+        self.sensor = sensor
+        self.emissivity = emissivity
+        if eeprom_emissivity is None:
+            eeprom_emissivity = sensor.read_emissivity()
+        self.eeprom_emissivity = eeprom_emissivity
+
+    def read_object_temp(self, emissivity=None, pec_check=True):
+        t_obj = self.sensor.read_object_temp(pec_check)
+        t_amb = self.sensor.read_ambient_temp(pec_check)
+        if emissivity is None:
+            emissivity = self.emissivity
+        return correct(t_obj, t_amb, emissivity, self.eeprom_emissivity)
@@ -0,0 +1,247 @@
+"""
+Emulated MLX90615 IR temperature sensor and I2C bus, for testing the MicroPython drivers on CPython :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import random
+import time
+
+
+MLX90615_I2C_DEFAULT_ADDR = 0x5B
+
+# EEPROM 0x10-0x1F from the README example, with emissivity 1.00 and ID 7623496
+DEFAULT_EEPROM = (13659, 2499, 5321, 16384, 24768, 13658, 17180, 8209,
+                  73, 32786, 7504, 616, 6765, 14908, 21320, 116)
+
+_REG_PWM_TMIN = 0x10
+_REG_PWM_TRANGE = 0x11
+_REG_CONFIG = 0x12
+_REG_RAW_IR_DATA = 0x25
+_REG_AMBIENT_TEMP = 0x26
+_REG_OBJECT_TEMP = 0x27
+_REG_SLEEP = 0xC6
+
+_PWM_SLOW_PERIOD_US = 1000             # 1 kHz
+_PWM_FAST_PERIOD_US = 100              # 10 kHz
+
+
+def crc8(icrc, data):
+    crc = icrc ^ data
+    for _ in range(8):
+        crc <<= 1
+        if crc & 0x0100:
+            crc ^= 0x07
+        crc &= 0xFF
+    return crc
+
+
+def centi_to_ram(t):
+    return (t + 27315 + 1) // 2
+
+
+class MLX90615Emulator:
+    def __init__(self, eeprom=DEFAULT_EEPROM, object_temp=3621, ambient_temp=3059, raw_ir=108, noise=0, seed=None, ir_gain=None):
+        self.eeprom = list(eeprom)
+        self.object_temp = object_temp
+        self.ambient_temp = ambient_temp
+        self.raw_ir = raw_ir
+        self.noise = noise
+        self.ir_gain = ir_gain
+        self.sleeping = False
+        self.busy_until_us = 0            # end of the EEPROM write in progress, in the emulated I2C bus clock
+        self.stale = None                 # (register, old value) of the EEPROM write in progress
+        self._random = random.Random(seed)
+        self._filtered = None
+        self._pwm_error = 0
+
+    def refresh(self):
+        # RAM update at each 0.5 s period : noisy measurement of 'object_temp' through the IIR filter,
+        # modelled with coefficient 1/iir, so iir=1 is unfiltered
+        iir = ((self.eeprom[_REG_CONFIG - 0x10] & 0x7000) >> 12) or 1
+        x = self.object_temp + self._random.gauss(0, self.noise) if self.noise else self.object_temp
+        if self._filtered is None:
+            self._filtered = x
+        else:
+            self._filtered += (x - self._filtered) / iir
+
+    @property
+    def object_ram_temp(self):
+        if self._filtered is None:
+            return self.object_temp
+        return round(self._filtered)
+
+    @property
+    def address(self):
+        return self.eeprom[0] & 0x007F
+
+    def read_word(self, register):
+        if self.sleeping:
+            raise OSError(19)
+        if 0x10 <= register <= 0x1F:
+            return self.eeprom[register - 0x10]
+        if register == _REG_RAW_IR_DATA:
+            if self.ir_gain is not None:
+                # raw IR follows the object temperature without the IIR filter delay
+                to = (self.object_temp + 27315) / 100
+                ta = (self.ambient_temp + 27315) / 100
+                return round((to**4 - ta**4)*self.ir_gain) & 0xFFFF
+            return self.raw_ir & 0xFFFF
+        if register == _REG_AMBIENT_TEMP:
+            return centi_to_ram(self.ambient_temp)
+        if register == _REG_OBJECT_TEMP:
+            return centi_to_ram(self.object_ram_temp)
+        raise OSError(5)
+
+    def write_word(self, register, data):
+        if self.sleeping:
+            raise OSError(19)
+        if not (0x10 <= register <= 0x1F):
+            raise OSError(5)
+        # EEPROM cells must be erased (written with 0) before a new value is written
+        if data == 0:
+            self.eeprom[register - 0x10] = 0
+        else:
+            self.eeprom[register - 0x10] |= data
+
+    def time_pulse_us(self, pin, pulse_level, timeout_us=1000000):
+        config = self.eeprom[_REG_CONFIG - 0x10]
+        if config & 0x0001:
+            return -2
+        period = _PWM_FAST_PERIOD_US if config & 0x0002 else _PWM_SLOW_PERIOD_US
+        t = self.ambient_temp if config & 0x0004 else self.object_ram_temp
+        tmin = self.eeprom[_REG_PWM_TMIN - 0x10]*2 - 27315
+        trange = self.eeprom[_REG_PWM_TRANGE - 0x10]*2
+        d = min(max(t - tmin, 0), trange)
+        # error diffusion, so the average of many periods is exact as in the real analog duty cycle
+        high = (d*period + self._pwm_error) // trange
+        self._pwm_error = (d*period + self._pwm_error) - high*trange
+        if pulse_level:
+            return high
+        return period - high
+
+
+class EmulatedI2C:
+    def __init__(self, *devices, pec_error_rate=0, nack_rate=0, delay_us=0, jitter_us=0, eeprom_write_ms=0,
+                 virtual_time=False, seed=None):
+        # faults injected on each register reading/writing : corrupted byte (PEC error), NACK (OSError) and delay,
+        # plus EEPROM busy for 'eeprom_write_ms' after each EEPROM write
+        self.devices = list(devices)
+        self.pec_error_rate = pec_error_rate
+        self.nack_rate = nack_rate
+        self.delay_us = delay_us
+        self.jitter_us = jitter_us
+        self.eeprom_write_ms = eeprom_write_ms
+        self.virtual_time = virtual_time
+        self.clock_us = 0                 # bus clock, advanced by the delays and 'sleep_ms()'
+        self.transactions = 0
+        self._random = random.Random(seed)
+        self._register = None
+
+    def reseed(self, seed):
+        self._random.seed(seed)
+
+    def _device(self, addr):
+        for device in self.devices:
+            if (addr == 0) or (device.address == addr):
+                return device
+        raise OSError(19)
+
+    def _delay(self):
+        self.transactions += 1
+        delay = self.delay_us
+        if self.jitter_us:
+            delay += self._random.randrange(self.jitter_us)
+        self.clock_us += delay
+        if delay and not self.virtual_time:
+            time.sleep(delay/1000000)
+
+    def sleep_ms(self, ms):
+        # to replace the 'sleep_ms()' of the driver module, so the EEPROM write time is measured in the bus clock
+        self.clock_us += ms*1000
+        if not self.virtual_time:
+            time.sleep(ms/1000)
+
+    def scan(self):
+        return sorted(d.address for d in self.devices if not d.sleeping)
+
+    def start(self):
+        for device in self.devices:
+            device.sleeping = False
+
+    def stop(self):
+        pass
+
+    def readfrom_mem_into(self, addr, memaddr, buf):
+        self._delay()
+        nack = self._random.random() < self.nack_rate
+        corrupt = self._random.random() < self.pec_error_rate
+        if nack:
+            raise OSError(19)
+        device = self._device(addr)
+        d = device.read_word(memaddr)
+        if (device.stale is not None) and (device.stale[0] == memaddr) and (self.clock_us < device.busy_until_us):
+            # EEPROM write in progress, the old value is read
+            d = device.stale[1]
+        lsb = d & 0x00FF
+        msb = d >> 8
+        crc = crc8(0, addr << 1)
+        crc = crc8(crc, memaddr)
+        crc = crc8(crc, (addr << 1) + 1)
+        crc = crc8(crc, lsb)
+        crc = crc8(crc, msb)
+        buf[0] = lsb; buf[1] = msb; buf[2] = crc
+        if corrupt:
+            buf[self._random.randrange(3)] ^= 1 << self._random.randrange(8)
+
+    def readfrom_mem(self, addr, memaddr, nbytes):
+        buf = bytearray(3)
+        self.readfrom_mem_into(addr, memaddr, buf)
+        return bytes(buf[:nbytes])
+
+    def writeto_mem(self, addr, memaddr, buf):
+        self._delay()
+        nack = self._random.random() < self.nack_rate
+        corrupt = self._random.random() < self.pec_error_rate
+        if nack:
+            raise OSError(19)
+        device = self._device(addr)
+        crc = crc8(0, addr << 1)
+        crc = crc8(crc, memaddr)
+        if memaddr == _REG_SLEEP:
+            if buf[0] == crc:
+                device.sleeping = True
+            return
+        crc = crc8(crc, buf[0])
+        crc = crc8(crc, buf[1])
+        if buf[2] != crc:
+            raise OSError(5)
+        if self.clock_us < device.busy_until_us:
+            # EEPROM write in progress, so the sensor doesn't acknowledge
+            raise OSError(19)
+        if corrupt:
+            # PEC corrupted on the bus, so the sensor discards the writing
+            return
+        old = device.eeprom[memaddr - 0x10] if 0x10 <= memaddr <= 0x1F else None
+        device.write_word(memaddr, buf[0] | (buf[1] << 8))
+        if self.eeprom_write_ms:
+            device.busy_until_us = self.clock_us + self.eeprom_write_ms*1000
+            device.stale = (memaddr, old)
+
+    # BBC Micro:bit I2C methods, where the register is written before reading
+    def write(self, addr, buf, repeat=False):
+        if len(buf) == 1:
+            self._device(addr)
+            self._register = buf[0]
+        else:
+            self.writeto_mem(addr, buf[0], buf[1:])
+
+    def read(self, addr, n, repeat=False):
+        buf = bytearray(3)
+        self.readfrom_mem_into(addr, self._register, buf)
+        return bytes(buf[:n])
@@ -0,0 +1,346 @@
+"""
+Columnar binary time series export for MLX90615 IR temperature sensor readings, with writer for MicroPython/CPython
+and reader for CPython :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import os
+import struct
+from array import array
+try:
+    from time import ticks_ms, ticks_diff
+except ImportError:
+    from time import monotonic
+    def ticks_ms():
+        return int(monotonic()*1000)
+    def ticks_diff(t1, t0):
+        return t1 - t0
+
+
+EXPORT_DEFAULT_BLOCK_SIZE = 256        # samples per block
+
+# little-endian file : header, then blocks with header (count, min/max indexes) and the columns
+_FILE_MAGIC = b'MLXT'
+_FILE_VERSION = 1
+_FILE_HEADER = '<4sHH8x'               # magic, version, block header size
+_FILE_HEADER_SIZE = 16
+_BLOCK_MAGIC = b'BLK1'
+_BLOCK_HEADER = '<4sIqqiiiiII'         # magic, count, timestamp/object temp./ambient temp./sensor ID min and max
+_BLOCK_HEADER_SIZE = 48
+# (name, typecode, item size) of the columns : timestamp (ms), sensor ID, object and ambient temp. (0.01 C), raw IR
+COLUMNS = (('timestamp', 'q', 8), ('sensor_id', 'I', 4), ('object_temp', 'i', 4), ('ambient_temp', 'i', 4),
+           ('raw_ir', 'H', 2))
+
+
+def _block_size(count):
+    # columns padded to 8 bytes, so all blocks and columns are aligned
+    size = _BLOCK_HEADER_SIZE
+    for _, _, item_size in COLUMNS:
+        size += (count*item_size + 7) & ~7
+    return size
+
+
+def _scan(read, find, size):
+    # yields (offset, header) of the complete blocks, 'read(offset, n)' returns bytes and 'find(start, end)' the offset
+    # of the next block magic. A block partially written (e. g. power loss while flushing) is skipped, resyncing to
+    # the next block magic, so the blocks before and after it are kept
+    offset = _FILE_HEADER_SIZE
+    while offset + _BLOCK_HEADER_SIZE <= size:
+        if read(offset, 4) == _BLOCK_MAGIC:
+            header = struct.unpack(_BLOCK_HEADER, read(offset, _BLOCK_HEADER_SIZE))
+            next_offset = offset + _block_size(header[1])
+            if (next_offset == size) or (read(next_offset, 4) == _BLOCK_MAGIC):
+                yield offset, header
+                offset = next_offset
+                continue
+            # a block magic inside the block means it was truncated, otherwise the damage is after the block
+            resync = find(offset + 4, min(next_offset, size))
+            if resync < 0:
+                if next_offset > size:
+                    return
+                yield offset, header
+                resync = next_offset
+            offset = resync
+        else:
+            offset = find(offset + 1, size)
+            if offset < 0:
+                return
+
+
+def _file_find(f, start, end, chunk=256):
+    while start < end:
+        f.seek(start)
+        data = f.read(min(chunk, end - start))
+        i = data.find(_BLOCK_MAGIC)
+        if i >= 0:
+            return start + i
+        if len(data) < len(_BLOCK_MAGIC):
+            break
+        start += len(data) - len(_BLOCK_MAGIC) + 1
+    return -1
+
+
+def _truncate(filename, size):
+    with open(filename, 'r+b') as f:
+        if hasattr(f, 'truncate'):
+            f.truncate(size)
+            return
+    # MicroPython files don't have truncate(), so the file is copied
+    buf = bytearray(512)
+    n = 0
+    with open(filename, 'rb') as src, open(filename + '.tmp', 'wb') as dst:
+        while n < size:
+            k = src.readinto(memoryview(buf)[:min(len(buf), size - n)])
+            if not k:
+                break
+            dst.write(memoryview(buf)[:k])
+            n += k
+    os.remove(filename)
+    os.rename(filename + '.tmp', filename)
+
+
+def _recover(filename):
+    # returns the last timestamp of the file (or None), removing a partially written last block
+    try:
+        f = open(filename, 'rb')
+    except OSError:
+        return None
+    size = f.seek(0, 2)
+
+    def read(offset, n):
+        f.seek(offset)
+        return f.read(n)
+
+    end = _FILE_HEADER_SIZE
+    last = None
+    for offset, header in _scan(read, lambda start, stop: _file_find(f, start, stop), size):
+        end = offset + _block_size(header[1])
+        last = header[3] if last is None else max(last, header[3])
+    f.close()
+    if _FILE_HEADER_SIZE <= end < size:
+        _truncate(filename, end)
+    return last
+
+
+class ColumnWriter:
+    def __init__(self, filename, block_size=EXPORT_DEFAULT_BLOCK_SIZE):
+        last = _recover(filename)
+        self.file = open(filename, 'ab')
+        if self.file.tell() < _FILE_HEADER_SIZE:
+            if self.file.tell() > 0:
+                # file header partially written (e. g. power loss), there are no samples to keep
+                self.file.close()
+                self.file = open(filename, 'wb')
+            self.file.write(struct.pack(_FILE_HEADER, _FILE_MAGIC, _FILE_VERSION, _BLOCK_HEADER_SIZE))
+        self.block_size = block_size
+        self.columns = [array(typecode, [0]*block_size) for _, typecode, _ in COLUMNS]
+        self.count = 0
+        self.pad = bytearray(8)
+        # recording clock in ms, unwrapping ticks_ms() and continuing after the last timestamp of the file
+        self.clock = 0 if last is None else last + 1
+        self.ticks = ticks_ms()
+
+    def now(self):
+        # should be called at least once each 6 days (half of the ticks_ms() period in MicroPython)
+        t = ticks_ms()
+        self.clock += ticks_diff(t, self.ticks)
+        self.ticks = t
+        return self.clock
+
+    def append(self, timestamp, sensor_id, object_temp, ambient_temp, raw_ir):
+        c = self.columns
+        i = self.count
+        c[0][i] = timestamp; c[1][i] = sensor_id; c[2][i] = object_temp; c[3][i] = ambient_temp; c[4][i] = raw_ir
+        self.count = i + 1
+        if self.count == self.block_size:
+            self.flush()
+
+    def record(self, sensor, sensor_id, timestamp=None, pec_check=True):
+        # reads and appends a sample of the 'sensor' (MLX90615 object), 'sensor_id' from 'read_id()', the default
+        # timestamp is the recording clock
+        if timestamp is None:
+            timestamp = self.now()
+        self.append(timestamp, sensor_id, sensor.read_object_temp(pec_check), sensor.read_ambient_temp(pec_check),
+                    sensor.read_raw_ir_data(pec_check))
+
+    def _min_max(self, column):
+        lo = hi = column[0]
+        for i in range(1, self.count):
+            v = column[i]
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        return lo, hi
+
+    def flush(self):
+        n = self.count
+        if n == 0:
+            return
+        c = self.columns
+        t_min, t_max = self._min_max(c[0])
+        id_min, id_max = self._min_max(c[1])
+        o_min, o_max = self._min_max(c[2])
+        a_min, a_max = self._min_max(c[3])
+        self.file.write(struct.pack(_BLOCK_HEADER, _BLOCK_MAGIC, n, t_min, t_max, o_min, o_max, a_min, a_max,
+                                    id_min, id_max))
+        for k in range(len(COLUMNS)):
+            size = n*COLUMNS[k][2]
+            self.file.write(memoryview(c[k])[:n])
+            if size & 7:
+                self.file.write(memoryview(self.pad)[:8 - (size & 7)])
+        self.file.flush()
+        self.count = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class Block:
+    def __init__(self, buf, offset):
+        (magic, self.count, self.timestamp_min, self.timestamp_max, self.object_min, self.object_max,
+         self.ambient_min, self.ambient_max, self.sensor_id_min, self.sensor_id_max) = \
+            struct.unpack_from(_BLOCK_HEADER, buf, offset)
+        if magic != _BLOCK_MAGIC:
+            raise Exception("Invalid block at offset {} of MLX90615 export file.".format(offset))
+        self.offset = offset
+        self.size = _block_size(self.count)
+
+    def columns(self, buf):
+        # returns the dictionary of the columns, as memoryviews of the file, without copying
+        columns = {}
+        offset = self.offset + _BLOCK_HEADER_SIZE
+        for name, typecode, item_size in COLUMNS:
+            columns[name] = buf[offset:offset + self.count*item_size].cast(typecode)
+            offset += (self.count*item_size + 7) & ~7
+        return columns
+
+
+class ColumnReader:
+    def __init__(self, filename):
+        import mmap
+        self.file = open(filename, 'rb')
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self.mmap)
+        magic, version, header_size = struct.unpack_from(_FILE_HEADER, self.buf, 0)
+        if (magic != _FILE_MAGIC) or (version != _FILE_VERSION) or (header_size != _BLOCK_HEADER_SIZE):
+            raise Exception("Invalid MLX90615 export file '{}'.".format(filename))
+        # index of the blocks, reading only the block headers
+        self.blocks = [Block(self.buf, offset) for offset, _ in
+                       _scan(lambda offset, n: bytes(self.buf[offset:offset + n]),
+                             lambda start, end: self.mmap.find(_BLOCK_MAGIC, start, end), len(self.buf))]
+
+    def __len__(self):
+        return sum(block.count for block in self.blocks)
+
+    def time_range(self):
+        # (min, max) of the timestamps, from the block headers
+        if not self.blocks:
+            return None, None
+        return min(b.timestamp_min for b in self.blocks), max(b.timestamp_max for b in self.blocks)
+
+    def select(self, t0=None, t1=None, sensor_id=None):
+        # yields (block, columns) of the blocks which may have samples with t0 <= timestamp < t1 and 'sensor_id'
+        for block in self.blocks:
+            if (t0 is not None) and (block.timestamp_max < t0):
+                continue
+            if (t1 is not None) and (block.timestamp_min >= t1):
+                continue
+            if (sensor_id is not None) and not (block.sensor_id_min <= sensor_id <= block.sensor_id_max):
+                continue
+            yield block, block.columns(self.buf)
+
+    def query(self, t0=None, t1=None, sensor_id=None):
+        # yields the samples (timestamp, sensor ID, object temp., ambient temp., raw IR) with t0 <= timestamp < t1
+        for block, c in self.select(t0, t1, sensor_id):
+            yield from self._block_query(block, c, t0, t1, sensor_id)
+
+    def object_range(self, t0=None, t1=None, sensor_id=None):
+        # (min, max) of the object temperature, using the block indexes for the blocks fully inside [t0, t1)
+        lo = hi = None
+        for block, c in self.select(t0, t1, sensor_id):
+            if ((t0 is None) or (block.timestamp_min >= t0)) and ((t1 is None) or (block.timestamp_max < t1)) and \
+                    ((sensor_id is None) or (block.sensor_id_min == block.sensor_id_max)):
+                values = (block.object_min, block.object_max)
+            else:
+                values = [s[2] for s in self._block_query(block, c, t0, t1, sensor_id)]
+            if values:
+                lo = min(values) if lo is None else min(lo, min(values))
+                hi = max(values) if hi is None else max(hi, max(values))
+        return lo, hi
+
+    def _block_query(self, block, c, t0, t1, sensor_id):
+        for i in range(block.count):
+            t = c['timestamp'][i]
+            if ((t0 is None) or (t >= t0)) and ((t1 is None) or (t < t1)) and \
+                    ((sensor_id is None) or (c['sensor_id'][i] == sensor_id)):
+                yield (t, c['sensor_id'][i], c['object_temp'][i], c['ambient_temp'][i], c['raw_ir'][i])
+
+    def to_csv(self, filename, t0=None, t1=None, sensor_id=None):
+        import csv
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([name for name, _, _ in COLUMNS])
+            writer.writerows(self.query(t0, t1, sensor_id))
+
+    def to_parquet(self, filename, t0=None, t1=None, sensor_id=None):
+        try:
+            import pyarrow
+            import pyarrow.compute
+            import pyarrow.parquet
+        except ImportError:
+            raise Exception("Error : pyarrow is needed to convert to Parquet.")
+        types = {'q': pyarrow.int64(), 'I': pyarrow.uint32(), 'i': pyarrow.int32(), 'H': pyarrow.uint16()}
+        schema = pyarrow.schema([(name, types[typecode]) for name, typecode, _ in COLUMNS])
+        tables = []
+        for block, c in self.select(t0, t1, sensor_id):
+            # arrays built on the columns of the block in the file, without converting the samples to Python objects
+            table = pyarrow.Table.from_arrays([pyarrow.Array.from_buffers(types[typecode], block.count,
+                                                                          [None, pyarrow.py_buffer(c[name])])
+                                               for name, typecode, _ in COLUMNS], schema=schema)
+            mask = None
+            for column, op, value in (('timestamp', pyarrow.compute.greater_equal, t0),
+                                      ('timestamp', pyarrow.compute.less, t1),
+                                      ('sensor_id', pyarrow.compute.equal, sensor_id)):
+                if value is not None:
+                    m = op(table[column], value)
+                    mask = m if mask is None else pyarrow.compute.and_(mask, m)
+            tables.append(table if mask is None else table.filter(mask))
+        table = pyarrow.concat_tables(tables) if tables else schema.empty_table()
+        pyarrow.parquet.write_table(table, filename)
+
+    def close(self):
+        self.buf.release()
+        self.mmap.close()
+        self.file.close()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Read a MLX90615 columnar export file.")
+    parser.add_argument('filename')
+    parser.add_argument('--start', type=int, help="start timestamp, in ms")
+    parser.add_argument('--end', type=int, help="end timestamp (excluded), in ms")
+    parser.add_argument('--sensor-id', type=int)
+    parser.add_argument('--csv', help="converts to CSV file")
+    parser.add_argument('--parquet', help="converts to Parquet file (needs pyarrow)")
+    args = parser.parse_args()
+    reader = ColumnReader(args.filename)
+    print("{} samples in {} blocks.".format(len(reader), len(reader.blocks)))
+    print("Object temperature range : {}".format(reader.object_range(args.start, args.end, args.sensor_id)))
+    if args.csv:
+        reader.to_csv(args.csv, args.start, args.end, args.sensor_id)
+    if args.parquet:
+        reader.to_parquet(args.parquet, args.start, args.end, args.sensor_id)
+    reader.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+MicroPython streaming filters for MLX90615 IR temperature sensor readings (integer 100x Celsius degrees) :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+from array import array
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+    def ticks_us():
+        return int(perf_counter()*1000000)
+    def ticks_diff(t1, t0):
+        return t1 - t0
+
+
+_KALMAN_SHIFT = const(10)              # Kalman gain and state scale, 2**10
+_KALMAN_P_SHIFT = const(4)             # Kalman variance scale, 2**4
+_KALMAN_P_MAX = const(1 << 19)         # scaled q + r limit, so all intermediates are < 2**30 (small integers)
+
+
+class MedianFilter:
+    def __init__(self, window=5):
+        self.ring = array('i', [0]*window)
+        self.sorted = array('i', [0]*window)
+        self.index = 0
+        self.count = 0
+
+    def update(self, x):
+        n = len(self.ring)
+        s = self.sorted
+        if self.count < n:
+            i = self.count
+            self.count += 1
+        else:
+            # replaces the oldest value in the sorted window by the new one, then moves it to its place
+            old = self.ring[self.index]
+            i = 0
+            while s[i] != old:
+                i += 1
+            while (i < n - 1) and (s[i + 1] < x):
+                s[i] = s[i + 1]
+                i += 1
+        while (i > 0) and (s[i - 1] > x):
+            s[i] = s[i - 1]
+            i -= 1
+        s[i] = x
+        self.ring[self.index] = x
+        self.index = (self.index + 1) % n
+        return s[self.count >> 1]
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+
+
+class EMAFilter:
+    def __init__(self, shift=2):
+        self.shift = shift                # smoothing factor alpha = 1/2**shift
+        self.state = None
+
+    def update(self, x):
+        if self.state is None:
+            self.state = x << self.shift
+        else:
+            self.state += x - ((self.state + (1 << self.shift >> 1)) >> self.shift)
+        return (self.state + (1 << self.shift >> 1)) >> self.shift
+
+    def reset(self):
+        self.state = None
+
+
+class KalmanFilter:
+    def __init__(self, q=1, r=100):
+        self.q = q                        # process noise variance, in (0.01 C)**2 per sample
+        self.r = r                        # measurement noise variance, in (0.01 C)**2
+        if not ((q >= 0) and (r >= 1) and ((q + r) << _KALMAN_P_SHIFT < _KALMAN_P_MAX)):
+            raise Exception("Error : Kalman q {} and r {} out of range (q >= 0, r >= 1, q + r < 32768).".format(q, r))
+        self.x = None
+        self.p = 0
+
+    def update(self, z):
+        # fixed point, with state 'x' scaled by 2**_KALMAN_SHIFT and variance 'p' by 2**_KALMAN_P_SHIFT, so small
+        # corrections aren't rounded to zero and all intermediates are small integers (< 2**30) in MicroPython
+        if self.x is None:
+            self.x = z << _KALMAN_SHIFT
+            self.p = self.r << _KALMAN_P_SHIFT
+        else:
+            p = self.p + (self.q << _KALMAN_P_SHIFT)
+            # gain scaled by 2**_KALMAN_SHIFT, at least 1 so the filter never freezes
+            k = (p << _KALMAN_SHIFT) // (p + (self.r << _KALMAN_P_SHIFT)) or 1
+            self.x += k*(z - ((self.x + (1 << _KALMAN_SHIFT >> 1)) >> _KALMAN_SHIFT))
+            self.p = ((1 << _KALMAN_SHIFT) - k)*p >> _KALMAN_SHIFT
+        return (self.x + (1 << _KALMAN_SHIFT >> 1)) >> _KALMAN_SHIFT
+
+    def reset(self):
+        self.x = None
+        self.p = 0
+
+
+class FilterChain:
+    def __init__(self, *filters):
+        self.filters = filters
+
+    def update(self, x):
+        for f in self.filters:
+            x = f.update(x)
+        return x
+
+    def reset(self):
+        for f in self.filters:
+            f.reset()
+
+
+def benchmark(filt, n=1000, start=3621):
+    # cost per sample in us, with a synthetic sawtooth with spikes
+    x = start
+    t0 = ticks_us()
+    for i in range(n):
+        filt.update(x + (i & 0x0F) + (500 if (i & 0x3F) == 0 else 0))
+    return ticks_diff(ticks_us(), t0) / n
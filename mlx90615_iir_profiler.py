@@ -0,0 +1,118 @@
+"""
+IIR filter profiler for MLX90615 IR temperature I2C sensor, measuring noise and settling time of each IIR setting :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import json
+from math import sqrt
+
+
+REFRESH_MS = 500                       # MLX90615 RAM refresh period, 2 Hz
+SETTLE_PERCENT = 90
+
+
+def read_samples(sensor, wait, n):
+    samples = [0]*n
+    for i in range(n):
+        wait()
+        samples[i] = sensor.read_object_temp()
+    return samples
+
+
+def noise_std(samples):
+    mean = sum(samples) / len(samples)
+    return round(sqrt(sum((s - mean)**2 for s in samples) / len(samples)))
+
+
+def settle_time_ms(start, response, percent=SETTLE_PERCENT):
+    # final value is the mean of the last quarter of the step response
+    tail = response[-max(len(response)//4, 1):]
+    final = sum(tail) / len(tail)
+    target = start + (final - start)*percent/100
+    for i, t in enumerate(response):
+        if ((final >= start) and (t >= target)) or ((final < start) and (t <= target)):
+            return (i + 1)*REFRESH_MS
+    return None
+
+
+def profile_iir(sensor, iir, step, wait, noise_samples=40, step_samples=40, eeprom_write_time=50):
+    try:
+        sensor.set_iir_filter(iir, eeprom_write_time=eeprom_write_time)
+    except Exception as err:
+        raise Exception("Error setting IIR filter {} for profiling.\n{}".format(iir, err))
+    step(False)
+    read_samples(sensor, wait, step_samples)             # settling to the low level
+    steady = read_samples(sensor, wait, noise_samples)
+    step(True)
+    response = read_samples(sensor, wait, step_samples)
+    start = sum(steady) / len(steady)
+    return {'iir': iir, 'noise': noise_std(steady), 'settle_ms': settle_time_ms(start, response)}
+
+
+def profile_all(sensor, step, wait, iirs=range(1, 8), noise_samples=40, step_samples=40, eeprom_write_time=50):
+    iir = sensor.read_iir_filter()
+    try:
+        return [profile_iir(sensor, i, step, wait, noise_samples, step_samples, eeprom_write_time) for i in iirs]
+    finally:
+        sensor.set_iir_filter(iir, eeprom_write_time=eeprom_write_time)
+
+
+def choose_iir(table, noise_budget):
+    best = None
+    for row in table:
+        if (row['noise'] <= noise_budget) and (row['settle_ms'] is not None):
+            if (best is None) or (row['settle_ms'] < best['settle_ms']):
+                best = row
+    return None if best is None else best['iir']
+
+
+def save_table(table, filename):
+    with open(filename, 'w') as f:
+        json.dump(table, f)
+
+
+def load_table(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def print_table(table):
+    print("IIR | noise (0.01 C) | settle {}% (ms)".format(SETTLE_PERCENT))
+    for row in table:
+        print("{:3d} | {:14d} | {}".format(row['iir'], row['noise'], row['settle_ms']))
+
+
+def main():
+    import argparse
+    import mlx90615
+    import mlx90615_emulator
+    parser = argparse.ArgumentParser(description="Profile MLX90615 IIR filter settings with the emulated sensor.")
+    parser.add_argument('--noise', type=float, default=10, help="emulated sensor noise, in 0.01 C")
+    parser.add_argument('--low', type=int, default=2500, help="step low object temperature, in 0.01 C")
+    parser.add_argument('--high', type=int, default=3700, help="step high object temperature, in 0.01 C")
+    parser.add_argument('--budget', type=int, help="noise budget, in 0.01 C, to choose the fastest IIR setting")
+    parser.add_argument('--output', help="JSON file to save the characterisation table")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    emu = mlx90615_emulator.MLX90615Emulator(noise=args.noise, seed=args.seed)
+    sensor = mlx90615.MLX90615(mlx90615_emulator.EmulatedI2C(emu))
+
+    def step(high):
+        emu.object_temp = args.high if high else args.low
+
+    table = profile_all(sensor, step, emu.refresh, eeprom_write_time=0)
+    print_table(table)
+    if args.output:
+        save_table(table, args.output)
+    if args.budget is not None:
+        print("Fastest IIR setting with noise <= {} : {}".format(args.budget, choose_iir(table, args.budget)))
+
+
+if __name__ == '__main__':
+    main()
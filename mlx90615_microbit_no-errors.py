@@ -9,8 +9,17 @@ License: MIT License (https://opensource.org/licenses/MIT)
 __version__ = '0.2.1'
 
 
-from micropython import const
-import time
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+try:
+    from time import sleep_ms
+except ImportError:
+    from time import sleep
+    def sleep_ms(ms):
+        sleep(ms/1000)
 
 
 MLX90615_I2C_DEFAULT_ADDR = const(0x5B)
@@ -57,7 +66,7 @@ class MLX90615:
         crc = self._crc8(crc, lsb)
         crc = self._crc8(crc, msb)
         self.i2c.write(self.address, bytearray([register, lsb, msb, crc]), repeat=True)   
-        time.sleep_ms(eeprom_time)
+        sleep_ms(eeprom_time)
 
     def read_ambient_temp(self):
         return (self.read16(_REG_AMBIENT_TEMP))*2 - 27315
@@ -86,11 +95,11 @@ class MLX90615:
     def set_emissivity(self, value=100, eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
         if (value >= 5) and (value <= 100):
             e = round((value*0x4000)/100)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_EMISSIVITY, 0x0000, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_EMISSIVITY, e, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
 
     def read_i2c_address(self):
         return self.read16(_REG_SLAVE_I2C_ADDRESS) & 0x007F
@@ -99,8 +108,8 @@ class MLX90615:
         if self.address == 0:
             if (addr >= 0x08) and (addr <= 0x77):
                 d = 0x3500 | addr       
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_SLAVE_I2C_ADDRESS, 0x0000, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_SLAVE_I2C_ADDRESS, d, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
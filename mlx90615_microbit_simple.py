@@ -9,7 +9,11 @@ License: MIT License (https://opensource.org/licenses/MIT)
 __version__ = '0.2.1'
 
 
-from micropython import const
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
 
 
 MLX90615_I2C_DEFAULT_ADDR = const(0x5B)
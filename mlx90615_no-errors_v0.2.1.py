@@ -9,8 +9,21 @@ License: MIT License (https://opensource.org/licenses/MIT)
 __version__ = '0.2.1'
 
 
-import time
-import machine
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+try:
+    from time import sleep_ms
+except ImportError:
+    from time import sleep
+    def sleep_ms(ms):
+        sleep(ms/1000)
+try:
+    import machine
+except ImportError:
+    machine = None
 
 
 MLX90615_I2C_DEFAULT_ADDR = const(0x5B)
@@ -59,7 +72,7 @@ class MLX90615:
         crc = self._crc8(crc, msb)
         self.buf[0] = lsb; self.buf[1] = msb; self.buf[2] = crc
         self.i2c.writeto_mem(self.address, register, self.buf)
-        time.sleep_ms(eeprom_time)
+        sleep_ms(eeprom_time)
 
     def read_ambient_temp(self):
         return (self.read16(_REG_AMBIENT_TEMP))*2 - 27315
@@ -88,11 +101,11 @@ class MLX90615:
     def set_emissivity(self, value=100, eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
         if (value >= 5) and (value <= 100):
             e = round((value*0x4000)/100)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_EMISSIVITY, 0x0000, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_EMISSIVITY, e, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
 
     def read_i2c_address(self):
         return self.read16(_REG_SLAVE_I2C_ADDRESS) & 0x007F
@@ -101,11 +114,11 @@ class MLX90615:
         if self.address == 0:
             if (addr >= 0x08) and (addr <= 0x77):
                 d = 0x3500 | addr       
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_SLAVE_I2C_ADDRESS, 0x0000, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
                 self.write16(_REG_SLAVE_I2C_ADDRESS, d, eeprom_time=eeprom_write_time)
-                time.sleep_ms(eeprom_write_time)
+                sleep_ms(eeprom_write_time)
 
     def sleep(self):
         crc = self._crc8(0, self.address << 1)
@@ -117,15 +130,15 @@ class MLX90615:
     def wake(self, scl_pin):
         p = machine.Pin(scl_pin, machine.Pin.OUT)
         p.value(0)
-        time.sleep_ms(50)
+        sleep_ms(50)
         self.i2c.start()
-        time.sleep_ms(500)
+        sleep_ms(500)
         self.i2c.scan()
 
     def pwm_to_i2c(self, scl_pin):
         p = machine.Pin(scl_pin, machine.Pin.OUT)
         p.value(0)
-        time.sleep_ms(100)
+        sleep_ms(100)
         self.i2c.start()
         self.i2c.scan()
             
@@ -134,21 +147,21 @@ class MLX90615:
 
     def set_pwm_tmin(self, tmin=0x355B, eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
         if self.address == 0:
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_PWM_TMIN, 0x0000, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
             self.write16(_REG_PWM_TMIN, tmin, eeprom_time=eeprom_write_time)
-            time.sleep_ms(eeprom_write_time)
+            sleep_ms(eeprom_write_time)
 
     def read_pwm_trange(self):
         return self.read16(_REG_PWM_TRANGE)
 
     def set_pwm_trange(self, trange=0x09C3, eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_PWM_TRANGE, 0x0000, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_PWM_TRANGE, trange, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
 
     def read_pwm_mode(self):
         return ((self.read16(_REG_CONFIG) & 0x0001) == 0)
@@ -158,11 +171,11 @@ class MLX90615:
         d &= 0xFFFE
         if not pwm:
             d |= 0x0001
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, 0x0000, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, d, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
 
     def read_pwm_fast(self):
         return ((self.read16(_REG_CONFIG) & 0x0002) != 0)
@@ -172,11 +185,11 @@ class MLX90615:
         d &= 0xFFFD
         if pwm_fast:
             d |= 0x0002
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, 0x0000, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, d, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
 
     def read_pwm_object_temp(self):
         return ((self.read16(_REG_CONFIG) & 0x0004) == 0)
@@ -186,11 +199,11 @@ class MLX90615:
         d &= 0xFFFB
         if not object_temp:
             d |= 0x0004               
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, 0x0000, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, d, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
 
     def read_iir_filter(self):
         return ((self.read16(_REG_CONFIG) & 0x7000) >> 12)
@@ -199,8 +212,8 @@ class MLX90615:
         d = self.read16(_REG_CONFIG)
         d &= 0x8FFF
         d |= (iir & 0x0007) << 12
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, 0x0000, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
         self.write16(_REG_CONFIG, d, eeprom_time=eeprom_write_time)
-        time.sleep_ms(eeprom_write_time)
+        sleep_ms(eeprom_write_time)
@@ -0,0 +1,237 @@
+"""
+Provisioning tool for MLX90615 IR temperature I2C sensors, writing a configuration manifest to the EEPROM of many sensors :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import json
+import os
+import mlx90615
+try:
+    from time import ticks_ms, ticks_diff
+except ImportError:
+    from time import monotonic
+    def ticks_ms():
+        return int(monotonic()*1000)
+    def ticks_diff(t1, t0):
+        return t1 - t0
+
+
+EEPROM_DEFAULT_TIME_MS = mlx90615.EEPROM_DEFAULT_TIME_MS
+
+_REG_PWM_TMIN = 0x10                   # EEPROM register - PWM temperature minimum and slave I2C address
+_REG_PWM_TRANGE = 0x11                 # EEPROM register - PWM temperature range
+_REG_CONFIG = 0x12                     # EEPROM register - Config
+_REG_EMISSIVITY = 0x13                 # EEPROM register - Emissivity
+
+MANIFEST_KEYS = ('i2c_address', 'pwm_tmin', 'pwm_trange', 'pwm', 'pwm_fast', 'pwm_object_temp', 'iir', 'emissivity')
+
+
+def _set_bit(d, mask, value):
+    return (d | mask) if value else (d & ~mask)
+
+
+def validate_manifest(manifest):
+    # checks all keys and values of the manifest, before writing to any sensor
+    ranges = {'i2c_address': (0x08, 0x77, "new I2C address"), 'pwm_tmin': (0x0000, 0xFFFF, "PWM TMIN"),
+              'pwm_trange': (0x0000, 0xFFFF, "PWM TRANGE"), 'iir': (1, 7, "IIR filter"),
+              'emissivity': (5, 100, "emissivity")}
+    for key, value in manifest.items():
+        if key not in MANIFEST_KEYS:
+            raise Exception("Error : unknown manifest key '{}'.".format(key))
+        if key in ranges:
+            lo, hi, name = ranges[key]
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise Exception("Error : manifest '{}' value {!r} is not an integer.".format(key, value))
+            if not ((value >= lo) and (value <= hi)):
+                raise Exception("Error : {} value {} out of range ({} <= value <= {}).".format(name, value, lo, hi))
+        elif not isinstance(value, bool):
+            raise Exception("Error : manifest '{}' value {!r} is not a boolean.".format(key, value))
+
+
+def manifest_hash(manifest):
+    # FNV-1a 32 bits of the manifest keys and values, independent of the keys order
+    h = 0x811C9DC5
+    for c in ','.join('{}={}'.format(key, int(manifest[key])) for key in MANIFEST_KEYS if key in manifest):
+        h = ((h ^ ord(c))*0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def desired_eeprom(eeprom, manifest):
+    # returns the dictionary {register: value} of the EEPROM registers 0x10-0x13 configured by the manifest
+    validate_manifest(manifest)
+    tmin = manifest.get('pwm_tmin', eeprom[_REG_PWM_TMIN - 0x10]) & 0xFF80
+    addr = manifest.get('i2c_address', eeprom[_REG_PWM_TMIN - 0x10] & 0x007F)
+    config = eeprom[_REG_CONFIG - 0x10]
+    if 'pwm' in manifest:
+        config = _set_bit(config, 0x0001, not manifest['pwm'])
+    if 'pwm_fast' in manifest:
+        config = _set_bit(config, 0x0002, manifest['pwm_fast'])
+    if 'pwm_object_temp' in manifest:
+        config = _set_bit(config, 0x0004, not manifest['pwm_object_temp'])
+    if 'iir' in manifest:
+        config = (config & 0x8FFF) | (manifest['iir'] << 12)
+    emissivity = eeprom[_REG_EMISSIVITY - 0x10]
+    if 'emissivity' in manifest:
+        emissivity = round((manifest['emissivity']*0x4000)/100)
+    return {_REG_PWM_TMIN: tmin | addr,
+            _REG_PWM_TRANGE: manifest.get('pwm_trange', eeprom[_REG_PWM_TRANGE - 0x10]),
+            _REG_CONFIG: config,
+            _REG_EMISSIVITY: emissivity}
+
+
+class Provisioner:
+    def __init__(self, i2c, manifest, journal='mlx90615_journal.json', backup_dir='.', retries=3,
+                 eeprom_write_time=EEPROM_DEFAULT_TIME_MS):
+        # the sensor being provisioned should be alone on the I2C bus, accessed with address 0x00
+        validate_manifest(manifest)
+        self.sensor = mlx90615.MLX90615(i2c, address=0)
+        self.manifest = manifest
+        self.journal = journal
+        self.backup_dir = backup_dir
+        self.retries = retries
+        self.eeprom_write_time = eeprom_write_time
+        self.hash = manifest_hash(manifest)
+        # sensors provisioned with the same manifest, a sensor done with another manifest is provisioned again
+        self.done = set()
+        for entry in self._read_journal():
+            if (entry['status'] == 'done') and (entry.get('manifest') == self.hash):
+                self.done.add(entry['id'])
+
+    def _read_journal(self):
+        try:
+            with open(self.journal) as f:
+                lines = f.readlines()
+        except OSError:
+            return []
+        entries = []
+        for i, line in enumerate(lines):
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                if i < len(lines) - 1:
+                    raise Exception("Error : damaged line {} of journal '{}'.".format(i + 1, self.journal))
+        if lines and not lines[-1].endswith('\n'):
+            # last line partially written (e. g. power loss), rewritten without it so the next entries are on new lines
+            with open(self.journal + '.tmp', 'w') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + '\n')
+            try:
+                os.rename(self.journal + '.tmp', self.journal)
+            except OSError:
+                os.remove(self.journal)
+                os.rename(self.journal + '.tmp', self.journal)
+        return entries
+
+    def _log(self, entry):
+        entry['manifest'] = self.hash
+        with open(self.journal, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    def _backup(self, sensor_id, eeprom):
+        # the first backup is kept, as it has the EEPROM before any provisioning
+        filename = '{}/mlx90615_{}.json'.format(self.backup_dir, sensor_id)
+        try:
+            with open(filename):
+                return
+        except OSError:
+            pass
+        with open(filename, 'w') as f:
+            json.dump({'id': sensor_id, 'eeprom': eeprom}, f)
+
+    def _write_register(self, register, data):
+        err = None
+        for _ in range(self.retries):
+            try:
+                self.sensor.write16(register, 0x0000, read_check=False, eeprom_time=self.eeprom_write_time)
+                self.sensor.write16(register, data, read_check=False, eeprom_time=self.eeprom_write_time)
+                if self.sensor.read16(register, crc_check=True) == data:
+                    return
+                err = "read {:04x} != {:04x}".format(self.sensor.read16(register, crc_check=True), data)
+            except Exception as e:
+                err = e
+        raise Exception("Error writing EEPROM register {:02x}.\n{}".format(register, err))
+
+    def provision(self):
+        # returns (sensor ID, list of written registers), or (sensor ID, None) if already provisioned
+        sensor_id = self.sensor.read_id()
+        if sensor_id in self.done:
+            return sensor_id, None
+        eeprom = self.sensor.read_eeprom()
+        self._backup(sensor_id, eeprom)
+        self._log({'id': sensor_id, 'status': 'started', 'eeprom': eeprom})
+        written = []
+        try:
+            for register, data in sorted(desired_eeprom(eeprom, self.manifest).items()):
+                if eeprom[register - 0x10] != data:
+                    self._write_register(register, data)
+                    written.append(register)
+        except Exception as err:
+            self._log({'id': sensor_id, 'status': 'failed', 'written': written, 'error': str(err)})
+            raise
+        self._log({'id': sensor_id, 'status': 'done', 'written': written})
+        self.done.add(sensor_id)
+        return sensor_id, written
+
+    def run(self, next_sensor, count=None):
+        # 'next_sensor(n)' is called before each sensor, e. g. asking the operator to connect it, returning False to stop
+        report = {'provisioned': 0, 'skipped': 0, 'failed': 0, 'failures': []}
+        t0 = ticks_ms()
+        n = 0
+        while ((count is None) or (n < count)) and next_sensor(n):
+            n += 1
+            try:
+                sensor_id, written = self.provision()
+            except Exception as err:
+                report['failed'] += 1
+                report['failures'].append(str(err))
+                continue
+            if written is None:
+                report['skipped'] += 1
+            else:
+                report['provisioned'] += 1
+        elapsed = ticks_diff(ticks_ms(), t0) / 1000
+        report['elapsed_s'] = elapsed
+        report['sensors_per_minute'] = (60*report['provisioned']/elapsed) if elapsed > 0 else 0
+        return report
+
+
+def main():
+    import argparse
+    import random
+    import mlx90615_emulator
+    parser = argparse.ArgumentParser(description="Provision emulated MLX90615 sensors with a JSON manifest.")
+    parser.add_argument('manifest', help="JSON file with the desired configuration, keys : " + ', '.join(MANIFEST_KEYS))
+    parser.add_argument('--emulate', type=int, default=10, help="number of emulated sensors")
+    parser.add_argument('--journal', default='mlx90615_journal.json')
+    parser.add_argument('--backup-dir', default='.')
+    parser.add_argument('--eeprom-write-time', type=int, default=0, help="erase/write EEPROM time in ms")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    rnd = random.Random(args.seed)
+    i2c = mlx90615_emulator.EmulatedI2C()
+
+    def next_sensor(n):
+        eeprom = list(mlx90615_emulator.DEFAULT_EEPROM)
+        eeprom[14] = rnd.getrandbits(16)
+        eeprom[15] = rnd.getrandbits(16)
+        i2c.devices = [mlx90615_emulator.MLX90615Emulator(eeprom)]
+        return True
+
+    provisioner = Provisioner(i2c, manifest, args.journal, args.backup_dir, eeprom_write_time=args.eeprom_write_time)
+    report = provisioner.run(next_sensor, args.emulate)
+    print("Provisioned {provisioned}, skipped {skipped}, failed {failed} sensors in {elapsed_s:.2f} s, "
+          "{sensors_per_minute:.1f} sensors per minute.".format(**report))
+    for failure in report['failures']:
+        print(failure)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+MicroPython PWM reader for MLX90615 IR temperature sensor :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+from array import array
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+try:
+    from machine import time_pulse_us
+except ImportError:
+    time_pulse_us = None
+
+
+PWM_DEFAULT_TMIN = const(0x355B)       # EEPROM factory default PWM TMIN, +0.03 C
+PWM_DEFAULT_TRANGE = const(0x09C3)     # EEPROM factory default PWM TRANGE, 49.98 C
+PWM_DEFAULT_PERIODS = const(8)         # number of PWM periods averaged for each reading
+PWM_TIMEOUT_US = const(5000)           # 5x the slow (1 kHz) PWM period
+
+
+class MLX90615_PWM:
+    def __init__(self, pin, tmin=PWM_DEFAULT_TMIN, trange=PWM_DEFAULT_TRANGE, periods=PWM_DEFAULT_PERIODS,
+                 timeout_us=PWM_TIMEOUT_US, pulse_us=None):
+        self.pin = pin
+        self.tmin = tmin*2 - 27315
+        self.trange = trange*2
+        self.timeout_us = timeout_us
+        self.pulse_us = pulse_us if pulse_us is not None else time_pulse_us
+        self.high = array('i', [0]*periods)
+        self.low = array('i', [0]*periods)
+
+    def read_pulses(self):
+        # time_pulse_us() starts timing straight away if the pin is already at the pulse level, so a pulse is only
+        # timed right after the opposite pulse : the high pulses are timed in consecutive periods, then the low ones.
+        # The 1st call of each level may start in the middle of a pulse, so it is discarded to sync
+        for level, pulses in ((1, self.high), (0, self.low)):
+            if self.pulse_us(self.pin, level, self.timeout_us) < 0:
+                raise Exception("PWM pulse timeout error, check if PWM mode is enabled.")
+            for i in range(len(pulses)):
+                p = self.pulse_us(self.pin, level, self.timeout_us)
+                if p < 0:
+                    raise Exception("PWM pulse timeout error, check if PWM mode is enabled.")
+                pulses[i] = p
+
+    def _sums(self):
+        high = 0
+        period = 0
+        for i in range(len(self.high)):
+            high += self.high[i]
+            period += self.high[i] + self.low[i]
+        if period == 0:
+            raise Exception("Invalid PWM period error.")
+        return high, period
+
+    def read_duty(self):
+        self.read_pulses()
+        high, period = self._sums()
+        return (10000*high + period//2) // period
+
+    def read_temp(self):
+        self.read_pulses()
+        high, period = self._sums()
+        return self.tmin + (self.trange*high + period//2) // period
@@ -0,0 +1,121 @@
+"""
+MicroPython fast-response object temperature estimator from the raw IR data of MLX90615 IR temperature sensor :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+from array import array
+from math import sqrt
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+from mlx90615_emissivity import radiance, temperature
+
+
+RAW_IR_DEFAULT_SAMPLES = const(64)     # calibration samples kept
+RAW_IR_DEFAULT_WINDOW = const(4)       # readings of the steady-state detection
+RAW_IR_DEFAULT_STEADY = const(4)       # maximum object temp. variation in steady state, 0.01 C
+_A_SHIFT = const(16)                   # slope scale, 2**16
+
+
+def raw_signed(d):
+    # raw IR data register is a signed 16 bits integer
+    return d - 0x10000 if d & 0x8000 else d
+
+
+class RawIREstimator:
+    def __init__(self, sensor, samples=RAW_IR_DEFAULT_SAMPLES, window=RAW_IR_DEFAULT_WINDOW,
+                 steady=RAW_IR_DEFAULT_STEADY):
+        self.sensor = sensor
+        self.steady = steady
+        # calibration samples in a ring, the oldest ones replaced, so the calibration follows slow drifts
+        self.raw = array('i', [0]*samples)
+        self.ambient = array('i', [0]*samples)
+        self.object = array('i', [0]*samples)
+        self.count = 0
+        self.index = 0
+        self.recent = array('i', [0]*window)
+        self.recent_count = 0
+        self.a = None                     # radiance(To) - radiance(Ta) = (a*raw >> _A_SHIFT) + b
+        self.b = 0
+        self.rms = 0
+        self.raw_min = 0
+        self.raw_max = 0
+
+    def _is_steady(self, object_temp):
+        n = len(self.recent)
+        self.recent[self.recent_count % n] = object_temp
+        self.recent_count += 1
+        if self.recent_count < n:
+            return False
+        lo = hi = self.recent[0]
+        for t in self.recent:
+            lo = min(lo, t)
+            hi = max(hi, t)
+        return hi - lo <= self.steady
+
+    def calibrate(self, pec_check=True):
+        # reads the sensor and keeps the sample if the object temperature is steady, returning True if kept
+        object_temp = self.sensor.read_object_temp(pec_check)
+        ambient_temp = self.sensor.read_ambient_temp(pec_check)
+        raw = raw_signed(self.sensor.read_raw_ir_data(pec_check))
+        if not self._is_steady(object_temp):
+            return False
+        i = self.index
+        self.raw[i] = raw
+        self.ambient[i] = ambient_temp
+        self.object[i] = object_temp
+        self.index = (i + 1) % len(self.raw)
+        self.count = min(self.count + 1, len(self.raw))
+        return True
+
+    def fit(self):
+        # least squares fit of radiance(object) - radiance(ambient) versus raw IR, returning the RMS error in 0.01 C
+        n = self.count
+        sx = sy = sxx = sxy = 0
+        for i in range(n):
+            x = self.raw[i]
+            y = radiance(self.object[i]) - radiance(self.ambient[i])
+            sx += x; sy += y; sxx += x*x; sxy += x*y
+        d = n*sxx - sx*sx
+        if (n < 2) or (d == 0):
+            raise Exception("Error : raw IR calibration needs steady-state samples at 2 or more object temperatures.")
+        self.a = ((n*sxy - sx*sy) << _A_SHIFT) // d
+        self.b = (sy - ((self.a*sx) >> _A_SHIFT)) // n
+        self.raw_min = min(self.raw[i] for i in range(n))
+        self.raw_max = max(self.raw[i] for i in range(n))
+        e2 = 0
+        for i in range(n):
+            e = self.predict(self.raw[i], self.ambient[i]) - self.object[i]
+            e2 += e*e
+        self.rms = round(sqrt(e2/n))
+        return self.rms
+
+    def predict(self, raw, ambient_temp):
+        return temperature(radiance(ambient_temp) + ((self.a*raw) >> _A_SHIFT) + self.b)
+
+    def uncertainty(self, raw, ambient_temp, t):
+        # RMS error of the calibration, plus half of the extrapolation outside the calibrated raw IR range
+        u = self.rms
+        if raw > self.raw_max:
+            u += abs(t - self.predict(self.raw_max, ambient_temp)) >> 1
+        elif raw < self.raw_min:
+            u += abs(t - self.predict(self.raw_min, ambient_temp)) >> 1
+        return u
+
+    def read_object_temp(self, pec_check=True, ambient_temp=None):
+        # returns (estimated object temp., uncertainty), both in 0.01 C, 'ambient_temp' can be passed to save a reading
+        if self.a is None:
+            raise Exception("Error : raw IR estimator is not calibrated.")
+        raw = raw_signed(self.sensor.read_raw_ir_data(pec_check))
+        if ambient_temp is None:
+            ambient_temp = self.sensor.read_ambient_temp(pec_check)
+        t = self.predict(raw, ambient_temp)
+        return t, self.uncertainty(raw, ambient_temp, t)
@@ -9,6 +9,13 @@ License: MIT License (https://opensource.org/licenses/MIT)
 __version__ = '0.2.1'
 
 
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
+
 MLX90615_I2C_DEFAULT_ADDR = const(0x5B)
 
 _REG_ID_LOW = const(0x1E)              # EEPROM register - ID number low
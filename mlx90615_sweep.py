@@ -0,0 +1,161 @@
+"""
+Parallel sweep of MLX90615 IR temperature I2C sensors on many I2C buses, with a thread per bus and latency histograms
+(CPython) :
+https://github.com/rcolistete/MicroPython_MLX90615_driver
+Version : 0.3.0 @ 2026/10/18
+Author: Roberto Colistete Jr. (roberto.colistete at gmail.com)
+License: MIT License (https://opensource.org/licenses/MIT)
+"""
+
+__version__ = '0.3.0'
+
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+import mlx90615
+
+
+_BUCKETS_PER_OCTAVE = 4
+_BUCKETS = 26*_BUCKETS_PER_OCTAVE      # up to 2**26 us = 67 s
+
+
+class LatencyHistogram:
+    def __init__(self):
+        # logarithmic buckets, 4 per octave, so the percentiles have <= 19% error
+        self.counts = [0]*_BUCKETS
+        self.count = 0
+        self.total_us = 0
+
+    def record(self, us):
+        i = 0
+        if us >= 1:
+            i = min(int(us).bit_length()*_BUCKETS_PER_OCTAVE - _BUCKETS_PER_OCTAVE +
+                    int((us / (1 << (int(us).bit_length() - 1)) - 1)*_BUCKETS_PER_OCTAVE), _BUCKETS - 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total_us += us
+
+    def percentile(self, p):
+        # upper bound (us) of the bucket with the percentile 'p' (0 to 100)
+        if self.count == 0:
+            return None
+        target = p*self.count/100
+        n = 0
+        for i, c in enumerate(self.counts):
+            n += c
+            if (n >= target) and (c > 0):
+                octave, step = divmod(i + 1, _BUCKETS_PER_OCTAVE)
+                return (1 << octave)*(1 + step/_BUCKETS_PER_OCTAVE)
+        return None
+
+    def mean(self):
+        return self.total_us / self.count if self.count else None
+
+
+class ParallelSweep:
+    def __init__(self, buses, pec_check=True):
+        # 'buses' is a dictionary {bus name: (I2C object, list of MLX90615 I2C addresses)}
+        self.buses = {}
+        self.histograms = {}
+        for name, (i2c, addresses) in buses.items():
+            sensors = [mlx90615.MLX90615(i2c, address) for address in addresses]
+            # the sensors of a bus are read by the same thread, so they share the reading buffer
+            for sensor in sensors[1:]:
+                sensor.buf = sensors[0].buf
+            self.buses[name] = sensors
+            self.histograms[name] = LatencyHistogram()
+        self.pec_check = pec_check
+        self.errors = {name: 0 for name in buses}
+        self.executor = ThreadPoolExecutor(max_workers=len(self.buses), thread_name_prefix='mlx90615_bus')
+
+    def _read_bus(self, name):
+        # the I2C transactions release the GIL, so the buses are read in parallel
+        histogram = self.histograms[name]
+        results = []
+        for sensor in self.buses[name]:
+            t0 = time.perf_counter()
+            try:
+                t = sensor.read_object_temp(self.pec_check)
+            except Exception:
+                t = None
+                self.errors[name] += 1
+            histogram.record((time.perf_counter() - t0)*1000000)
+            results.append(((name, sensor.address), t))
+        return results
+
+    def sweep(self):
+        # returns a frame, dictionary with 'timestamp' (s), 'duration_s' and 'readings' {(bus name, address): temp.}
+        timestamp = time.time()
+        t0 = time.perf_counter()
+        readings = {}
+        for results in self.executor.map(self._read_bus, self.buses):
+            readings.update(results)
+        return {'timestamp': timestamp, 'duration_s': time.perf_counter() - t0, 'readings': readings}
+
+    def run(self, count, period=0):
+        frames = []
+        for _ in range(count):
+            t0 = time.perf_counter()
+            frames.append(self.sweep())
+            time.sleep(max(period - (time.perf_counter() - t0), 0))
+        return frames
+
+    def stats(self):
+        return {name: {'count': h.count, 'errors': self.errors[name], 'mean_us': h.mean(),
+                       'p50_us': h.percentile(50), 'p99_us': h.percentile(99)} for name, h in self.histograms.items()}
+
+    def close(self):
+        self.executor.shutdown()
+
+
+def serial_sweep(buses, pec_check=True):
+    # reference serial loop over all sensors of all buses
+    readings = {}
+    for name, (i2c, addresses) in buses.items():
+        for address in addresses:
+            try:
+                readings[(name, address)] = mlx90615.MLX90615(i2c, address).read_object_temp(pec_check)
+            except Exception:
+                readings[(name, address)] = None
+    return readings
+
+
+def main():
+    import argparse
+    import mlx90615_emulator
+    parser = argparse.ArgumentParser(description="Parallel sweep of emulated MLX90615 sensors on many I2C buses.")
+    parser.add_argument('--buses', type=int, default=4)
+    parser.add_argument('--sensors', type=int, default=8, help="sensors per bus")
+    parser.add_argument('--latency-us', type=int, default=1000, help="emulated latency of each I2C transaction")
+    parser.add_argument('--sweeps', type=int, default=10)
+    args = parser.parse_args()
+    buses = {}
+    for b in range(args.buses):
+        emus = []
+        for s in range(args.sensors):
+            eeprom = list(mlx90615_emulator.DEFAULT_EEPROM)
+            eeprom[0] = (eeprom[0] & 0xFF80) | (0x10 + s)
+            emus.append(mlx90615_emulator.MLX90615Emulator(eeprom, object_temp=3000 + 100*b + s))
+        buses['bus{}'.format(b)] = (mlx90615_emulator.EmulatedI2C(*emus, delay_us=args.latency_us),
+                                    [emu.address for emu in emus])
+    n = args.buses*args.sensors
+    t0 = time.perf_counter()
+    for _ in range(args.sweeps):
+        serial = serial_sweep(buses)
+    serial_s = (time.perf_counter() - t0) / args.sweeps
+    sweep = ParallelSweep(buses)
+    frames = sweep.run(args.sweeps)
+    parallel_s = sum(f['duration_s'] for f in frames) / len(frames)
+    if frames[-1]['readings'] != serial:
+        print("Error : parallel and serial readings differ.")
+    print("{} buses x {} sensors, {} us per I2C transaction :".format(args.buses, args.sensors, args.latency_us))
+    print("serial   : {:8.1f} ms per sweep, {:8.1f} readings/s".format(1000*serial_s, n/serial_s))
+    print("parallel : {:8.1f} ms per sweep, {:8.1f} readings/s, speedup {:.2f}x".format(
+        1000*parallel_s, n/parallel_s, serial_s/parallel_s))
+    for name, s in sweep.stats().items():
+        print("{} : {count} readings, {errors} errors, p50 {p50_us:.0f} us, p99 {p99_us:.0f} us".format(name, **s))
+    sweep.close()
+
+
+if __name__ == '__main__':
+    main()